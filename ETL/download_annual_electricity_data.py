@@ -139,23 +139,15 @@ def run_data_retrieval(args: argparse.Namespace) -> None:
                 & (global_electricity_data["Year"].isin(years))
             ]
 
-            # Extract the electricity demand and demand per capita data.
-            electricity_demand = pandas.Series(
-                country_electricity_data[
-                    country_electricity_data["Variable"] == "Demand"
-                ]["Value"].values,
-                index=country_electricity_data[
-                    country_electricity_data["Variable"] == "Demand"
-                ]["Year"],
-            )
-            electricity_demand_per_capita = pandas.Series(
-                country_electricity_data[
-                    country_electricity_data["Variable"] == "Demand per capita"
-                ]["Value"].values,
-                index=country_electricity_data[
-                    country_electricity_data["Variable"] == "Demand per capita"
-                ]["Year"],
-            )
+            # Extract the electricity demand and demand per capita data,
+            # comparing the variable names only once per variable.
+            variables = country_electricity_data["Variable"]
+            electricity_demand = country_electricity_data[
+                variables == "Demand"
+            ].set_index("Year")["Value"]
+            electricity_demand_per_capita = country_electricity_data[
+                variables == "Demand per capita"
+            ].set_index("Year")["Value"]
 
             # Get the time zone of the country.
             time_zone = utils.entities.get_time_zone(code)
@@ -14,8 +14,12 @@ Description:
 """
 
 import argparse
+import concurrent.futures
+import hashlib
 import logging
 import os
+import tempfile
+import time
 from datetime import datetime
 
 import pandas
@@ -156,6 +160,27 @@ def read_command_line_arguments() -> argparse.Namespace:
         action="store_true",
         required=False,
     )
+    parser.add_argument(
+        "-w",
+        "--max_workers",
+        type=int,
+        default=1,
+        help=(
+            "The maximum number of requests sent to the data source at once. "
+            "By default, the requests are sent one after the other."
+        ),
+        required=False,
+    )
+    parser.add_argument(
+        "-a",
+        "--cache_max_age",
+        type=float,
+        help=(
+            "The maximum age in seconds of the cached time series of each "
+            "request. If not provided, the time series are not cached."
+        ),
+        required=False,
+    )
     parser.add_argument(
         "-m",
         "--made_by_oet",
@@ -170,12 +195,102 @@ def read_command_line_arguments() -> argparse.Namespace:
     return args
 
 
-def retrieve_data(data_source: str, code: str) -> pandas.Series:
+def retrieve_data_of_request(
+    data_source: str,
+    request_arguments: tuple,
+    cache_max_age: float | None = None,
+) -> pandas.Series:
+    """
+    Retrieve the electricity demand data of a request.
+
+    This function retrieves the electricity demand time series of a
+    single request to the specified data source. If a maximum cache age
+    is provided, the time series is stored in a parquet file and read
+    from it instead of the data source as long as the file is not older
+    than the maximum cache age.
+
+    Parameters
+    ----------
+    data_source : str
+        The data source.
+    request_arguments : tuple
+        The arguments of the retrieval function for the request.
+    cache_max_age : float | None, optional
+        The maximum age in seconds of the cached time series. If None,
+        the time series is not cached.
+
+    Returns
+    -------
+    electricity_demand_time_series : pandas.Series
+        The electricity demand time series in MW.
+    """
+    # Get the retrieval function to download and extract the data.
+    retrieval_function = retrieval_module[
+        data_source
+    ].download_and_extract_data_for_request
+
+    if cache_max_age is None:
+        # Retrieve the electricity demand time series from the data
+        # source.
+        return retrieval_function(*request_arguments)
+
+    # Define the path of the cached time series, named by the data
+    # source and the arguments of the request.
+    cache_directory = os.path.join(
+        utils.directories.read_folders_structure()["retrieval_cache_folder"],
+        data_source,
+    )
+    os.makedirs(cache_directory, exist_ok=True)
+    cache_file_path = os.path.join(
+        cache_directory,
+        hashlib.sha1(repr(request_arguments).encode()).hexdigest()
+        + ".parquet",
+    )
+
+    # Read the cached time series if it is recent enough.
+    if (
+        os.path.exists(cache_file_path)
+        and time.time() - os.path.getmtime(cache_file_path) <= cache_max_age
+    ):
+        return pandas.read_parquet(cache_file_path).iloc[:, 0]
+
+    # Retrieve the electricity demand time series from the data source.
+    electricity_demand_time_series = retrieval_function(*request_arguments)
+
+    # Store the time series in the cache, unless it is empty, which may
+    # be caused by a temporary failure of the data source. The time
+    # series is written to a temporary file first, so that an
+    # interrupted run does not leave an incomplete file in the cache.
+    if not electricity_demand_time_series.empty:
+        temporary_file_descriptor, temporary_file_path = tempfile.mkstemp(
+            dir=cache_directory, suffix=".tmp"
+        )
+        os.close(temporary_file_descriptor)
+        try:
+            electricity_demand_time_series.to_frame(
+                name="Load (MW)"
+            ).to_parquet(temporary_file_path)
+        except Exception:
+            # Remove the incomplete file before raising the error.
+            os.remove(temporary_file_path)
+            raise
+        os.replace(temporary_file_path, cache_file_path)
+
+    return electricity_demand_time_series
+
+
+def retrieve_data(
+    data_source: str,
+    code: str,
+    max_workers: int = 1,
+    cache_max_age: float | None = None,
+) -> pandas.Series:
     """
     Retrieve the electricity demand data.
 
     This function retrieves the electricity demand time series from the
-    specified data source.
+    specified data source. If the data is retrieved with multiple
+    requests, the requests are sent in parallel threads.
 
     Parameters
     ----------
@@ -183,6 +298,11 @@ def retrieve_data(data_source: str, code: str) -> pandas.Series:
         The data source.
     code : str
         The code of the country or subdivision.
+    max_workers : int, optional
+        The maximum number of requests sent at the same time.
+    cache_max_age : float | None, optional
+        The maximum age in seconds of the cached time series of each
+        request. If None, the time series are not cached.
 
     Returns
     -------
@@ -222,41 +342,50 @@ def retrieve_data(data_source: str, code: str) -> pandas.Series:
             # needs to be specified.
             electricity_demand_time_series = retrieval_function(code)
 
+        # Store the values in single precision, which is more than
+        # enough for the electricity demand in MW.
+        electricity_demand_time_series = electricity_demand_time_series.astype(
+            "float32"
+        )
+
     else:
         # If there are multiple requests (request is not None), loop
         # over the requests to retrieve the electricity demand time
         # series of each request.
-        # Get the retrieval function to download and extract the data.
-        retrieval_function = retrieval_module[
-            data_source
-        ].download_and_extract_data_for_request
-
-        if one_code_in_data_source:
-            # If there is only one code in the data source, there is no
-            # need to specify the code.
-            # Loop over the requests to retrieve the electricity demand
-            # time series of each request.
-            electricity_demand_time_series_list = [
-                retrieval_function(*request)
-                if isinstance(request, tuple)
-                else retrieval_function(request)
-                for request in requests
-            ]
-        else:
+        # Define the arguments of the retrieval function for each
+        # request.
+        request_arguments = [
+            request if isinstance(request, tuple) else (request,)
+            for request in requests
+        ]
+        if not one_code_in_data_source:
             # If there are multiple codes in the data source, the code
             # needs to be specified.
-            # Loop over the requests to retrieve the electricity demand
-            # time series of each request.
-            electricity_demand_time_series_list = [
-                retrieval_function(*request, code)
-                if isinstance(request, tuple)
-                else retrieval_function(request, code)
-                for request in requests
+            request_arguments = [
+                (*arguments, code) for arguments in request_arguments
             ]
 
-        # Remove empty time series.
+        # Retrieve the electricity demand time series of each request,
+        # in parallel threads if more than one worker is allowed, as the
+        # requests mostly wait for the server. The time series are
+        # returned in the order of the requests.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            electricity_demand_time_series_list = list(
+                executor.map(
+                    lambda arguments: retrieve_data_of_request(
+                        data_source, arguments, cache_max_age
+                    ),
+                    request_arguments,
+                )
+            )
+
+        # Remove empty time series and store the values in single
+        # precision, which is more than enough for the electricity
+        # demand in MW and halves the memory of the concatenation.
         electricity_demand_time_series_list = [
-            time_series
+            time_series.astype("float32")
             for time_series in electricity_demand_time_series_list
             if not time_series.empty
         ]
@@ -386,7 +515,9 @@ def run_data_retrieval(args: argparse.Namespace) -> None:
         logging.info(f"Retrieving data for {code}.")
 
         # Retrieve the electricity demand time series.
-        electricity_demand_time_series = retrieve_data(args.data_source, code)
+        electricity_demand_time_series = retrieve_data(
+            args.data_source, code, args.max_workers, args.cache_max_age
+        )
 
         # Save the electricity demand time series to a file and upload
         # it to GCS.
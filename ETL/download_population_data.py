@@ -126,9 +126,11 @@ def run_data_retrieval(args: argparse.Namespace) -> None:
             f"gpw_v4_population_density_rev11_{year}_30_sec_{year}.tif"
         )
 
-        # Download the population density data.
+        # Open the population density data lazily with the blocks of
+        # the raster, so that only the blocks overlapping each country
+        # or subdivision are downloaded.
         global_population_density = xarray.open_dataarray(
-            url, engine="rasterio"
+            url, engine="rasterio", chunks={}
         )
 
         # Harmonize the population density data.
@@ -149,7 +149,10 @@ def run_data_retrieval(args: argparse.Namespace) -> None:
                 f"Global data for the year {year} already exists. Using existing file."
             )
 
-            global_data = xarray.open_dataarray(global_file_path)
+            # Open the global data lazily with the chunks of the file,
+            # so that only the chunks overlapping each country or
+            # subdivision are read from disk.
+            global_data = xarray.open_dataarray(global_file_path, chunks={})
 
             # Harmonize the coordinates of the global data.
             global_data = utils.geospatial.harmonize_coords(global_data)
@@ -16,9 +16,15 @@ Description:
     Source: https://ember-energy.org/data/yearly-electricity-data/
 """  # noqa: W505
 
+import datetime
+import io
+import math
 import os
+import shutil
+import tempfile
+import time
 import zipfile
-from io import BytesIO
+from collections import defaultdict
 
 import matplotlib.patches
 import matplotlib.pyplot
@@ -31,7 +37,10 @@ import utils.entities
 from tailwind_colors import TAILWIND_COLORS_HEX
 
 
-def _get_year_fractions(codes: list[str]) -> dict[str, dict[str, float]]:
+def _get_year_fractions(
+    codes: list[str],
+    data_time_ranges: dict[str, tuple[datetime.date, datetime.date]],
+) -> dict[str, dict[str, float]]:
     """
     Get the fractions of years for which data is available.
 
@@ -40,6 +49,9 @@ def _get_year_fractions(codes: list[str]) -> dict[str, dict[str, float]]:
     codes : list[str]
         A list of ISO alpha-2 or a combination of ISO alpha-2 and
         subdivision codes.
+    data_time_ranges : dict[str, tuple[datetime.date, datetime.date]]
+        A dictionary where the keys are entity codes and the values are
+        the start and end dates of the available data.
 
     Returns
     -------
@@ -48,9 +60,6 @@ def _get_year_fractions(codes: list[str]) -> dict[str, dict[str, float]]:
         dictionaries with years as keys and fractions of years as
         values.
     """
-    # Get the data time range for all countries and subdivisions.
-    data_time_ranges = utils.entities.read_all_date_ranges()
-
     # Initialize a dictionary to store the fractions of years for which
     # data is available for each country or subdivision.
     fractions_of_years: dict[str, dict[str, float]] = {}
@@ -65,25 +74,73 @@ def _get_year_fractions(codes: list[str]) -> dict[str, dict[str, float]]:
             freq="d",
         )
 
-        # Initialize the dictionary for the current country or
-        # subdivision.
-        fractions_of_years[code] = {}
-
-        # Loop over the available years for the country or subdivision.
-        for year in days.year.unique():
-            # Define the days in the current year.
-            total_days_in_year = (
-                366 if pandas.Timestamp(year, 1, 1).is_leap_year else 365
-            )
+        # Count the days in each year of the time range in a single pass
+        # over the days.
+        day_years = days.year.to_numpy()
+        first_year = day_years[0]
+        days_per_year = numpy.bincount(day_years - first_year)
+        years = numpy.arange(first_year, first_year + len(days_per_year))
+
+        # Define the total number of days in each year, with the rules
+        # of the Gregorian calendar for leap years.
+        is_leap_year = (years % 4 == 0) & (
+            (years % 100 != 0) | (years % 400 == 0)
+        )
+        total_days_in_years = numpy.where(is_leap_year, 366, 365)
 
-            # Append the fraction of year for which data is available.
-            fractions_of_years[code][str(year)] = (
-                len(days[days.year == year]) / total_days_in_year
+        # Store the fraction of each year for which data is available.
+        fractions_of_years[code] = dict(
+            zip(
+                years.astype(str).tolist(),
+                (days_per_year / total_days_in_years).tolist(),
             )
+        )
 
     return fractions_of_years
 
 
+def _flatten_year_fractions(
+    codes: list[str],
+    fractions_of_years: dict[str, dict[str, float]],
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """
+    Flatten the fractions of years into parallel arrays.
+
+    Parameters
+    ----------
+    codes : list[str]
+        A list of ISO alpha-2 or a combination of ISO alpha-2 and
+        subdivision codes.
+    fractions_of_years : dict[str, dict[str, float]]
+        A dictionary where the keys are entity codes and the values are
+        dictionaries with years as keys and fractions of years as
+        values.
+
+    Returns
+    -------
+    entity_indices : numpy.ndarray
+        The indices of the entities in the list of codes.
+    years : numpy.ndarray
+        The years, as strings.
+    fractions : numpy.ndarray
+        The fractions of years for which data is available.
+    """
+    # Get the index of the entity, the year, and the fraction of year of
+    # all entities and years.
+    records = [
+        (entity_index, year, fraction)
+        for entity_index, code in enumerate(codes)
+        for year, fraction in fractions_of_years[code].items()
+    ]
+
+    # Split the records into parallel arrays.
+    return (
+        numpy.array([record[0] for record in records], dtype=int),
+        numpy.array([record[1] for record in records], dtype=str),
+        numpy.array([record[2] for record in records], dtype=float),
+    )
+
+
 def _retrieve_ember_electricity_data() -> pandas.DataFrame:
     """
     Fetch the electricity demand data from Ember.
@@ -91,26 +148,58 @@ def _retrieve_ember_electricity_data() -> pandas.DataFrame:
     Returns
     -------
     pandas.DataFrame
-        The electricity demand data from Ember.
+        The electricity demand per capita data from Ember in kWh, with
+        ISO alpha-3 codes as index and years as columns.
     """
-    # Fetch the data from the Ember dataset.
+    # Fetch the data from the Ember dataset. Only the columns used below
+    # are parsed, with compact data types and the PyArrow engine.
     ember_data = pandas.read_csv(
         "https://storage.googleapis.com/emb-prod-bkt-publicdata/"
-        "public-downloads/yearly_full_release_long_format.csv"
+        "public-downloads/yearly_full_release_long_format.csv",
+        engine="pyarrow",
+        usecols=["ISO 3 code", "Year", "Variable", "Value"],
+        dtype={
+            "ISO 3 code": "category",
+            "Year": "int16",
+            "Variable": "category",
+            "Value": "float64",
+        },
+    )
+
+    # Extract the data for the "Demand per capita" variable.
+    ember_data = ember_data[(ember_data["Variable"] == "Demand per capita")]
+
+    # Pivot the data once so that each country can be looked up by its
+    # ISO alpha-3 code, and convert MWh to kWh.
+    ember_data = (
+        ember_data.pivot_table(
+            index="ISO 3 code", columns="Year", values="Value", observed=True
+        )
+        * 1000
     )
 
-    # Extract and return the data for the "Demand per capita" variable.
-    return ember_data[(ember_data["Variable"] == "Demand per capita")]
+    # Use strings for the codes and years, as in the World Bank dataset.
+    ember_data.index = ember_data.index.astype(str)
+    ember_data.columns = ember_data.columns.astype(str)
+
+    return ember_data
 
 
 def _retrieve_world_bank_data(variable: str) -> pandas.DataFrame:
     """
     Fetch the data from the World Bank.
 
+    Parameters
+    ----------
+    variable : str
+        The variable to fetch, either "electricity_demand_per_capita" or
+        "gdp_per_capita".
+
     Returns
     -------
     pandas.DataFrame
-        The data from the World Bank.
+        The data from the World Bank, with ISO alpha-3 codes as index
+        and years as columns.
     """
     if variable == "electricity_demand_per_capita":
         url = (
@@ -123,101 +212,151 @@ def _retrieve_world_bank_data(variable: str) -> pandas.DataFrame:
             "NY.GDP.PCAP.PP.CD?downloadformat=csv"
         )
 
-    # Fetch the data from the World Bank.
-    response = requests.get(url)
-
-    # Extract the archive from the response.
-    archive = zipfile.ZipFile(BytesIO(response.content), "r")
+    # Define the path of the archive cached on disk between runs.
+    archive_directory = utils.directories.read_folders_structure()[
+        "data_folder"
+    ]
+    os.makedirs(archive_directory, exist_ok=True)
+    archive_file_path = os.path.join(
+        archive_directory, f"world_bank_{variable}.zip"
+    )
 
-    # Get the name of data file in the archive. It is the file that does
-    # not start with "Metadata" and ends with ".csv".
-    world_bank_file_name = [
-        name
-        for name in archive.namelist()
-        if not name.startswith("Metadata") and name.endswith(".csv")
-    ][0]
+    # Stream the archive from the World Bank to the cache if it does
+    # not exist or if it is older than one day. The archive is copied in
+    # chunks of 1 MiB to a temporary file in the same folder, which then
+    # replaces the cached archive, so that the response is never held in
+    # memory and an interrupted download does not leave a broken cache.
+    if (
+        not os.path.exists(archive_file_path)
+        or time.time() - os.path.getmtime(archive_file_path) > 86400
+    ):
+        with tempfile.NamedTemporaryFile(
+            dir=archive_directory, suffix=".tmp", delete=False
+        ) as temporary_file:
+            try:
+                with requests.get(url, stream=True, timeout=60) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, temporary_file, 1 << 20)
+            except Exception:
+                # Remove the incomplete download before raising the
+                # error.
+                temporary_file.close()
+                os.remove(temporary_file.name)
+                raise
+        os.replace(temporary_file.name, archive_file_path)
+
+    # Open the archive.
+    with zipfile.ZipFile(archive_file_path, "r") as archive:
+        # Get the name of data file in the archive. It is the file that
+        # does not start with "Metadata" and ends with ".csv".
+        world_bank_file_name = [
+            name
+            for name in archive.namelist()
+            if not name.startswith("Metadata") and name.endswith(".csv")
+        ][0]
+
+        # Read the data from the compressed CSV file through a large
+        # buffer, so that the file is decompressed in a few large reads.
+        # The four lines of metadata at the top of the file are skipped
+        # by giving the header row, because the PyArrow engine of pandas
+        # fails to parse this file with skiprows. The member of the
+        # archive is not a raw stream, but it provides the read methods
+        # that the buffered reader needs.
+        with io.BufferedReader(
+            archive.open(world_bank_file_name),  # type: ignore[type-var]
+            buffer_size=1 << 20,
+        ) as world_bank_file:
+            world_bank_data = pandas.read_csv(
+                world_bank_file, header=4, engine="pyarrow"
+            )
 
-    # Return the data from the compressed CSV file.
-    return pandas.read_csv(archive.open(world_bank_file_name), skiprows=4)
+    # Index the data by ISO alpha-3 code and keep only the year columns.
+    return world_bank_data.set_index("Country Code").filter(regex=r"^\d{4}$")
 
 
-def _extract_ember_electricity_data(
-    ember_data: pandas.DataFrame,
-    alpha_3_code: str,
-    years_of_interest: list[str],
-) -> pandas.Series:
+def _extract_entity_data(
+    data: pandas.DataFrame,
+    codes: list[str],
+    alpha_3_codes: dict[str, str],
+    years_of_interest: dict[str, list[str]],
+) -> dict[str, pandas.Series]:
     """
-    Extract the data for a specific country from the Ember dataset.
+    Extract the data of all countries and subdivisions from a dataset.
 
     Parameters
     ----------
-    alpha_3_code : str
-        The ISO alpha-3 code of the country.
-    ember_data : pandas.DataFrame
-        The Ember dataset.
+    data : pandas.DataFrame
+        The dataset, with ISO alpha-3 codes as index and years as
+        columns.
+    codes : list[str]
+        A list of ISO alpha-2 or a combination of ISO alpha-2 and
+        subdivision codes.
+    alpha_3_codes : dict[str, str]
+        A dictionary where the keys are entity codes and the values are
+        ISO alpha-3 codes.
+    years_of_interest : dict[str, list[str]]
+        A dictionary where the keys are entitiy codes and the values are
+        lists of strings representing the years of interest.
 
     Returns
     -------
-    pandas.Series
-        The data for the specified country.
+    dict[str, pandas.Series]
+        A dictionary where the keys are entity codes and the values are
+        the data for the years of interest.
     """
-    # Get the data for the country in the Ember dataset.
-    ember_series = ember_data[(ember_data["ISO 3 code"] == alpha_3_code)]
-
-    # Extract the values for the available years in the Ember dataset.
-    ember_series = ember_series[
-        ember_series["Year"].astype(str).isin(years_of_interest)
-    ]
-
-    # Convert to a Series with years as index, convert MWh to kWh, and
-    # return it.
-    return pandas.Series(
-        ember_series["Value"].to_numpy() * 1000,
-        index=ember_series["Year"].astype(str),
+    # Get the rows of all countries and subdivisions with a single
+    # reindex. Countries that are not in the dataset get rows of NaN.
+    entity_data = data.reindex(
+        [alpha_3_codes[code] for code in codes]
+    ).to_numpy(dtype=float)
+
+    # Flatten the years of interest of all countries and subdivisions,
+    # with the row of the respective entity in the extracted data.
+    number_of_years = [len(years_of_interest[code]) for code in codes]
+    row_indices = numpy.repeat(numpy.arange(len(codes)), number_of_years)
+    years = numpy.array(
+        [year for code in codes for year in years_of_interest[code]],
+        dtype=str,
     )
 
+    # Get the columns of all years of interest with a single lookup.
+    # Years that are not in the dataset get a column index of -1.
+    column_indices = data.columns.get_indexer(years)
+    is_available = column_indices >= 0
 
-def _extract_world_bank_data(
-    world_bank_data: pandas.DataFrame,
-    alpha_3_code: str,
-    years_of_interest: list[str],
-) -> pandas.Series:
-    """
-    Extract the data from the World Bank dataset.
-
-    Parameters
-    ----------
-    alpha_3_code : str
-        The ISO alpha-3 code of the country.
-    dataset : pandas.DataFrame
-        The World Bank dataset.
-
-    Returns
-    -------
-    pandas.Series
-        The data for the specified country and for the years of
-        interest.
-    """
-    # Get the data for the country in the World Bank dataset.
-    world_bank_series = world_bank_data[
-        world_bank_data["Country Code"] == alpha_3_code
-    ].iloc[:, 4:]
-
-    # Extract the values for the available years in the World Bank
-    # dataset.
-    world_bank_series = world_bank_series.iloc[
-        0, world_bank_series.columns.isin(years_of_interest)
+    # Gather the values of all entities and years of interest from the
+    # underlying array in a single step.
+    values = numpy.full(len(years), numpy.nan)
+    values[is_available] = entity_data[
+        row_indices[is_available], column_indices[is_available]
     ]
+    is_valid = ~numpy.isnan(values)
+
+    # Split the values and years by country or subdivision, and store
+    # them without NaN values. The dictionary structure is specified
+    # bacause required by the type hint.
+    split_indices = numpy.cumsum(number_of_years)[:-1]
+    extracted_data: dict[str, pandas.Series] = {
+        code: pandas.Series(
+            entity_values[entity_is_valid], index=entity_years[entity_is_valid]
+        )
+        for code, entity_values, entity_years, entity_is_valid in zip(
+            codes,
+            numpy.split(values, split_indices),
+            numpy.split(years, split_indices),
+            numpy.split(is_valid, split_indices),
+        )
+    }
 
-    # Return the series without NaN values.
-    return world_bank_series.dropna()
+    return extracted_data
 
 
 def _get_electricity_demand_data(
     codes: list[str],
     alpha_3_codes: dict[str, str],
     years_of_interest: dict[str, list[str]],
-) -> pandas.Series:
+) -> dict[str, pandas.Series]:
     """
     Get the electricity demand data.
 
@@ -234,9 +373,9 @@ def _get_electricity_demand_data(
 
     Returns
     -------
-    dict[str, dict[str, pandas.Series]]
-        The annual electricity demand data for the specified country and
-        for the years of interest.
+    dict[str, pandas.Series]
+        A dictionary where the keys are entity codes and the values are
+        the annual electricity demand data for the years of interest.
     """
     # Fetch the electricity demand data from Ember.
     ember_electricity_data = _retrieve_ember_electricity_data()
@@ -246,59 +385,27 @@ def _get_electricity_demand_data(
         "electricity_demand_per_capita"
     )
 
-    # Initialize the electricity demand data series for each country or
-    # subdivision. The dictionary structure is specified bacause
-    # required by the type hint.
-    electricity_demand_data: dict[str, dict[str, pandas.Series]] = {}
-
-    # Loop over the ISO alpha-3 codes.
-    for code in codes:
-        # Get the electricity demand data for the country and for the
-        # available years in the World Bank dataset.
-        world_bank_series = _extract_world_bank_data(
-            world_bank_electricity_data,
-            alpha_3_codes[code],
-            years_of_interest[code],
-        )
-
-        # Get the electricity demand data for the country and for the
-        # available years in the Ember dataset.
-        ember_series = _extract_ember_electricity_data(
-            ember_electricity_data,
-            alpha_3_codes[code],
-            years_of_interest[code],
-        )
-
-        # Combine the World Bank and Ember datasets, with an average of
-        # the two datasets for each year if both are available.
-        combined_series = (world_bank_series + ember_series) / 2
-
-        # Where the combined series is NaN because one of the datasets
-        # is missing, use the other dataset.
-        combined_series = combined_series.fillna(world_bank_series).fillna(
-            ember_series
-        )
-
-        # If the country is already in the dictionary, add a new key for
-        # the code.
-        if alpha_3_codes[code] in electricity_demand_data:
-            electricity_demand_data[alpha_3_codes[code]][code] = (
-                combined_series
-            )
-        else:
-            # If the country is not in the dictionary, add it.
-            electricity_demand_data[alpha_3_codes[code]] = {
-                code: combined_series
-            }
+    # Combine the World Bank and Ember datasets for all countries at
+    # once, with an average of the two datasets for each year if both
+    # are available, and the available dataset otherwise.
+    combined_electricity_data = world_bank_electricity_data.add(
+        ember_electricity_data, fill_value=0
+    ) / world_bank_electricity_data.notna().astype(int).add(
+        ember_electricity_data.notna().astype(int), fill_value=0
+    )
 
-    return electricity_demand_data
+    # Return the combined electricity demand data for each country or
+    # subdivision and for the years of interest.
+    return _extract_entity_data(
+        combined_electricity_data, codes, alpha_3_codes, years_of_interest
+    )
 
 
 def _get_world_bank_gdp_data(
     codes: list[str],
     alpha_3_codes: dict[str, str],
     years_of_interest: dict[str, list[str]],
-) -> pandas.Series:
+) -> dict[str, pandas.Series]:
     """
     Get the GDP per capita data.
 
@@ -315,46 +422,75 @@ def _get_world_bank_gdp_data(
 
     Returns
     -------
-    dict[str, dict[str, pandas.Series]]
-        The GDP per capita data for the specified country and for the
-        years of interest.
+    dict[str, pandas.Series]
+        A dictionary where the keys are entity codes and the values are
+        the GDP per capita data for the years of interest.
     """
     # Fetch the GDP per capita data from the World Bank.
     world_bank_gdp_data = _retrieve_world_bank_data("gdp_per_capita")
 
-    # Initialize the GDP data series for each country or subdivision.
-    # The dictionary structure is specified bacause required by the type
-    # hint.
-    gdp_data: dict[str, dict[str, pandas.Series]] = {}
+    # Return the GDP data for each country or subdivision and for the
+    # years of interest.
+    return _extract_entity_data(
+        world_bank_gdp_data, codes, alpha_3_codes, years_of_interest
+    )
+
 
-    # Loop over the ISO alpha-3 codes.
-    for code in codes:
-        # Get the GDP data for the country and for the available years
-        # in the World Bank dataset.
-        gdp_series = _extract_world_bank_data(
-            world_bank_gdp_data,
-            alpha_3_codes[code],
-            years_of_interest[code],
-        )
+def _bin_occurrences(
+    values: numpy.ndarray,
+    fractions: numpy.ndarray,
+    continent_ids: numpy.ndarray,
+    level_edges: numpy.ndarray,
+    number_of_continents: int,
+) -> numpy.ndarray:
+    """
+    Sum the fractions of years falling in each level and continent.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The flattened values of all entities and years.
+    fractions : numpy.ndarray
+        The fractions of years corresponding to the values.
+    continent_ids : numpy.ndarray
+        The continent indices corresponding to the values.
+    level_edges : numpy.ndarray
+        The sorted edges of the contiguous levels, i.e. the minimum
+        values of all levels followed by the maximum value of the last
+        level.
+    number_of_continents : int
+        The number of continents.
+
+    Returns
+    -------
+    numpy.ndarray
+        A matrix with continents as rows and levels as columns
+        containing the occurrences.
+    """
+    # Get the number of levels.
+    number_of_levels = len(level_edges) - 1
 
-        # If the country is already in the dictionary, add a new key for
-        # the code.
-        if alpha_3_codes[code] in gdp_data:
-            gdp_data[alpha_3_codes[code]][code] = gdp_series
-        else:
-            # If the country is not in the dictionary, add it.
-            gdp_data[alpha_3_codes[code]] = {code: gdp_series}
+    # Get the index of the level of each value. Values below the first
+    # edge, above the last edge, or NaN fall outside the levels.
+    level_ids = numpy.searchsorted(level_edges, values, side="right") - 1
+    in_levels = (level_ids >= 0) & (level_ids < number_of_levels)
 
-    return gdp_data
+    # Sum the fractions of years by continent and level in a single
+    # pass, using the flat index of each continent and level pair.
+    return numpy.bincount(
+        continent_ids[in_levels] * number_of_levels + level_ids[in_levels],
+        weights=fractions[in_levels],
+        minlength=number_of_continents * number_of_levels,
+    ).reshape(number_of_continents, number_of_levels)
 
 
 def _get_occurrences(
     data: dict[str, pandas.Series],
     codes: list[str],
-    alpha_3_codes: dict[str, str],
-    continent_codes: dict[str, str],
-    fractions_of_years: dict[str, dict[str, float]],
+    continent_ids: numpy.ndarray,
+    year_fractions: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray],
     levels: dict[str, tuple[int, int | float]],
+    continent_names: dict[str, str],
 ) -> dict[str, dict[str, float]]:
     """
     Get the occurrences of electricity demand or GDP per capita data.
@@ -368,19 +504,18 @@ def _get_occurrences(
     codes : list[str]
         A list of ISO alpha-2 or a combination of ISO alpha-2 and
         subdivision codes.
-    alpha_3_codes : dict[str, str]
-        A dictionary where the keys are entity codes and the values are
-        ISO alpha-3 codes.
-    continent_codes : dict[str, str]
-        A dictionary where the keys are entity codes and the values are
-        continent codes.
-    fractions_of_years : dict[str, dict[str, float]]
-        A dictionary where the keys are entity codes and the values are
-        dictionaries with years as keys and fractions of years as
-        values.
+    continent_ids : numpy.ndarray
+        The indices of the continents in continent_names, parallel to
+        the flattened fractions of years.
+    year_fractions : tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        The parallel arrays of entity indices, years, and fractions of
+        years, as returned by _flatten_year_fractions.
     levels : dict[str, tuple[int, int | float]]
         A dictionary where the keys are level names and the values are
         tuples with minimum and maximum values for the level.
+    continent_names : dict[str, str]
+        A dictionary where the keys are continent codes and the values
+        are continent names.
 
     Returns
     -------
@@ -388,25 +523,40 @@ def _get_occurrences(
         A dictionary where the keys are entity codes and the values are
         dictionaries with levels as keys and occurrences as values.
     """
-    # Initialize the occurrence in the defined levels and by continent.
-    occurrence = {
-        continent: {level: 0.0 for level in levels.keys()}
-        for continent in continent_names.keys()
-    }
+    # Unpack the flattened fractions of years.
+    entity_indices, years, fractions = year_fractions
+
+    # Get the values of all entities and years in the same order as the
+    # fractions of years. Missing values are NaN and fall outside the
+    # levels.
+    values = (
+        pandas.concat({code: data[code] for code in codes})
+        .reindex(
+            pandas.MultiIndex.from_arrays(
+                [numpy.array(codes)[entity_indices], years]
+            )
+        )
+        .to_numpy(dtype=float)
+    )
 
-    # Loop over the countries and subdivisions.
-    for code in codes:
-        # Loop over the available years for the country or subdivision.
-        for year in data[alpha_3_codes[code]][code].index:
-            # Loop over the levels and continents and add the occurrence
-            # to the corresponding level and continent.
-            for level, (min_val, max_val) in levels.items():
-                if min_val <= data[alpha_3_codes[code]][code][year] < max_val:
-                    occurrence[continent_codes[code]][level] += (
-                        fractions_of_years[code][year]
-                    )
+    # Get the occurrence in the defined levels and by continent.
+    occurrence_matrix = _bin_occurrences(
+        values,
+        fractions,
+        continent_ids,
+        numpy.array(
+            [min_val for min_val, _ in levels.values()]
+            + [list(levels.values())[-1][1]],
+            dtype=float,
+        ),
+        len(continent_names),
+    )
 
-    return occurrence
+    # Convert the occurrence matrix into a dictionary.
+    return {
+        continent: dict(zip(levels.keys(), occurrence_matrix[ii].tolist()))
+        for ii, continent in enumerate(continent_names)
+    }
 
 
 def _add_bar_chart(
@@ -414,6 +564,8 @@ def _add_bar_chart(
     levels: dict[str, tuple[int, int | float]],
     occurrence: dict[str, dict[str, float]],
     xlabel: str,
+    continent_names: dict[str, str],
+    colors: dict[str, str],
 ) -> matplotlib.axes.Axes:
     """
     Add a bar chart to the given axes.
@@ -430,6 +582,12 @@ def _add_bar_chart(
         are dictionaries with levels as keys and occurrences as values.
     xlabel : str
         The label for the x-axis.
+    continent_names : dict[str, str]
+        A dictionary where the keys are continent codes and the values
+        are continent names.
+    colors : dict[str, str]
+        A dictionary where the keys are continent codes and the values
+        are colors.
 
     Returns
     -------
@@ -462,9 +620,9 @@ def _add_bar_chart(
     ax.set_xticks(range(len(levels)))
     ax.set_xticklabels(
         [
-            f">{int(min_val / 1000)}"
-            if numpy.isinf(max_val)
-            else f"{int(min_val / 1000)} - {int(max_val / 1000)}"
+            f">{int(min_val // 1000)}"
+            if math.isinf(max_val)
+            else f"{int(min_val // 1000)} - {int(max_val // 1000)}"
             for min_val, max_val in levels.values()
         ]
     )
@@ -472,376 +630,375 @@ def _add_bar_chart(
     return ax
 
 
-# Create a directory to store the figures.
-figure_directory = utils.directories.read_folders_structure()["figures_folder"]
-os.makedirs(figure_directory, exist_ok=True)
-
-# Read the codes of all countries and subdivisions.
-codes = utils.entities.read_all_codes()
-
-# Get the ISO alpha-3 codes for all countries and subdivisions.
-alpha_3_codes = {}
-for code in codes:
-    alpha_3_codes[code] = utils.entities.get_iso_alpha_3_code(code)
-
-# Get the continent for each country.
-continent_codes = {}
-for code in codes:
-    continent_codes[code] = utils.entities.get_continent_code(code)
-
-# Get the fractions of years for which data is available for each
-# country or subdivision.
-fractions_of_years = _get_year_fractions(codes)
-
-# Extract the available years for each country or subdivision.
-available_years = {
-    code: list(fractions_of_years[code].keys()) for code in codes
-}
-
-# Get the electricity demand data from Ember and the World Bank.
-electricity_data = _get_electricity_demand_data(
-    codes,
-    alpha_3_codes,
-    available_years,
-)
-
-# Get the GDP per capita data from the World Bank.
-gdp_data = _get_world_bank_gdp_data(
-    codes,
-    alpha_3_codes,
-    available_years,
-)
-
-# Define the electricity demand groups.
-electricity_demand_levels = {
-    "Low demand": (0, 2000),
-    "Lower middle demand": (2000, 5000),
-    "Upper middle demand": (5000, 12000),
-    "High demand": (12000, float("inf")),
-}
-
-# Define the GDP groups.
-gdp_levels = {
-    "Low income": (0, 10000),
-    "Lower middle income": (10000, 30000),
-    "Upper middle income": (30000, 60000),
-    "High income": (60000, float("inf")),
-}
-
-# Define the labels for the continents.
-continent_names = {
-    "AF": "Africa",
-    "AS": "Asia",
-    "EU": "Europe",
-    "NA": "North America",
-    "SA": "South America",
-    "OC": "Oceania",
-}
-
-# Get the electricity demand occurrence in the defined electricity
-# demand levels and by continent.
-electricity_demand_occurrence = _get_occurrences(
-    electricity_data,
-    codes,
-    alpha_3_codes,
-    continent_codes,
-    fractions_of_years,
-    electricity_demand_levels,
-)
-
-# Get the GDP occurrence in the defined GDP levels and by continent.
-gdp_occurrence = _get_occurrences(
-    gdp_data,
-    codes,
-    alpha_3_codes,
-    continent_codes,
-    fractions_of_years,
-    gdp_levels,
-)
-
-# Define the colors for the continents.
-colors = {
-    "AF": TAILWIND_COLORS_HEX.VIOLET_900,  # Africa
-    "AS": TAILWIND_COLORS_HEX.GREEN_800,  # Asia
-    "EU": TAILWIND_COLORS_HEX.YELLOW_400,  # Europe
-    "NA": TAILWIND_COLORS_HEX.PINK_700,  # North America
-    "SA": TAILWIND_COLORS_HEX.RED_350,  # South America
-    "OC": TAILWIND_COLORS_HEX.CYAN_500,  # Oceania
-}
-
-# Set the font size.
-matplotlib.pyplot.rc("font", size=12)
-
-# Create a figure to plot the GDP coverage.
-fig, ax0 = matplotlib.pyplot.subplots(figsize=(10, 15))
-ax0.set_axis_off()
-
-# Add the bar chart for the electricity demand coverage.
-ax = fig.add_axes([0.05, 0.6, 0.4, 0.35])
-ax = _add_bar_chart(
-    ax,
-    gdp_levels,
-    gdp_occurrence,
-    "GDP per capita, PPP\n(current international k$)",
-)
-
-# Set the y-axis limit to the maximum cumulative height and the label.
-ax.set_ylim(0, 410)
-ax.set_ylabel("Number of years", fontsize=14)
-
-# Add the bar chart for the GDP coverage.
-ax = fig.add_axes([0.5, 0.6, 0.4, 0.35])
-ax = _add_bar_chart(
-    ax,
-    electricity_demand_levels,
-    electricity_demand_occurrence,
-    "Annual electricity demand\nper capita (MWh)",
-)
-# Set the y-axis limit to the maximum cumulative height.
-ax.set_ylim(0, 410)
-
-# Add scatter plot for the GDP and annual demand per capita data.
-ax = fig.add_axes([0.05, 0.05, 0.85, 0.48])
-
-# Make the x and y axes logarithmic.
-ax.set_xscale("log", base=2)
-ax.set_yscale("log", base=2)
-ax.xaxis.set_major_formatter(matplotlib.ticker.ScalarFormatter())
-ax.yaxis.set_major_formatter(matplotlib.ticker.ScalarFormatter())
-
-# Initialize the GDP and electricity demand data to plot.
-gdp_data_to_plot: dict[str, pandas.Series] = {}
-electricity_data_to_plot: dict[str, pandas.Series] = {}
-
-# Loop over the ISO alpha-3 codes and plot the data.
-for alpha_3_code in set(alpha_3_codes.values()):
-    # Get the codes belonging to the current alpha-3 code.
-    local_codes = [
-        code for code in codes if alpha_3_codes[code] == alpha_3_code
+if __name__ == "__main__":
+    # Create a directory to store the figures.
+    figure_directory = utils.directories.read_folders_structure()[
+        "figures_folder"
     ]
+    os.makedirs(figure_directory, exist_ok=True)
+
+    # Read the data time range of all countries and subdivisions. Their
+    # codes are the keys of the time ranges, so that the yaml files of
+    # the data sources are read only once.
+    data_time_ranges = utils.entities.read_all_date_ranges()
+    codes = list(data_time_ranges)
+
+    # Get the ISO alpha-3 code and the continent of all countries and
+    # subdivisions.
+    alpha_3_codes = {}
+    continent_codes = {}
+    for code in codes:
+        alpha_3_codes[code] = utils.entities.get_iso_alpha_3_code(code)
+        continent_codes[code] = utils.entities.get_continent_code(code)
+
+    # Get the fractions of years for which data is available for each
+    # country or subdivision.
+    fractions_of_years = _get_year_fractions(codes, data_time_ranges)
+
+    # Flatten the fractions of years into parallel arrays of entity
+    # indices, years, and fractions.
+    year_fractions = _flatten_year_fractions(codes, fractions_of_years)
+
+    # Extract the available years for each country or subdivision.
+    available_years = {
+        code: list(fractions_of_years[code].keys()) for code in codes
+    }
+
+    # Get the electricity demand data from Ember and the World Bank.
+    electricity_data = _get_electricity_demand_data(
+        codes,
+        alpha_3_codes,
+        available_years,
+    )
+
+    # Get the GDP per capita data from the World Bank.
+    gdp_data = _get_world_bank_gdp_data(
+        codes,
+        alpha_3_codes,
+        available_years,
+    )
+
+    # Define the electricity demand groups.
+    electricity_demand_levels = {
+        "Low demand": (0, 2000),
+        "Lower middle demand": (2000, 5000),
+        "Upper middle demand": (5000, 12000),
+        "High demand": (12000, float("inf")),
+    }
+
+    # Define the GDP groups.
+    gdp_levels = {
+        "Low income": (0, 10000),
+        "Lower middle income": (10000, 30000),
+        "Upper middle income": (30000, 60000),
+        "High income": (60000, float("inf")),
+    }
+
+    # Define the labels for the continents.
+    continent_names = {
+        "AF": "Africa",
+        "AS": "Asia",
+        "EU": "Europe",
+        "NA": "North America",
+        "SA": "South America",
+        "OC": "Oceania",
+    }
+
+    # Get the index of the continent of each entity and year in the
+    # flattened fractions of years, following the order of the continent
+    # names, once for all occurrence calculations.
+    continent_index = {
+        continent_code: ii for ii, continent_code in enumerate(continent_names)
+    }
+    continent_ids = numpy.array(
+        [continent_index[continent_codes[code]] for code in codes], dtype=int
+    )[year_fractions[0]]
+
+    # Get the electricity demand occurrence in the defined electricity
+    # demand levels and by continent.
+    electricity_demand_occurrence = _get_occurrences(
+        electricity_data,
+        codes,
+        continent_ids,
+        year_fractions,
+        electricity_demand_levels,
+        continent_names,
+    )
+
+    # Get the GDP occurrence in the defined GDP levels and by continent.
+    gdp_occurrence = _get_occurrences(
+        gdp_data,
+        codes,
+        continent_ids,
+        year_fractions,
+        gdp_levels,
+        continent_names,
+    )
+
+    # Define the colors for the continents.
+    colors = {
+        "AF": TAILWIND_COLORS_HEX.VIOLET_900,  # Africa
+        "AS": TAILWIND_COLORS_HEX.GREEN_800,  # Asia
+        "EU": TAILWIND_COLORS_HEX.YELLOW_400,  # Europe
+        "NA": TAILWIND_COLORS_HEX.PINK_700,  # North America
+        "SA": TAILWIND_COLORS_HEX.RED_350,  # South America
+        "OC": TAILWIND_COLORS_HEX.CYAN_500,  # Oceania
+    }
+
+    # Set the font size.
+    matplotlib.pyplot.rc("font", size=12)
+
+    # Create a figure to plot the GDP coverage.
+    fig, ax0 = matplotlib.pyplot.subplots(figsize=(10, 15))
+    ax0.set_axis_off()
+
+    # Add the bar chart for the electricity demand coverage.
+    ax = fig.add_axes([0.05, 0.6, 0.4, 0.35])
+    ax = _add_bar_chart(
+        ax,
+        gdp_levels,
+        gdp_occurrence,
+        "GDP per capita, PPP\n(current international k$)",
+        continent_names,
+        colors,
+    )
+
+    # Set the y-axis limit to the maximum cumulative height and the
+    # label.
+    ax.set_ylim(0, 410)
+    ax.set_ylabel("Number of years", fontsize=14)
+
+    # Add the bar chart for the GDP coverage.
+    ax = fig.add_axes([0.5, 0.6, 0.4, 0.35])
+    ax = _add_bar_chart(
+        ax,
+        electricity_demand_levels,
+        electricity_demand_occurrence,
+        "Annual electricity demand\nper capita (MWh)",
+        continent_names,
+        colors,
+    )
+    # Set the y-axis limit to the maximum cumulative height.
+    ax.set_ylim(0, 410)
+
+    # Add scatter plot for the GDP and annual demand per capita data.
+    ax = fig.add_axes([0.05, 0.05, 0.85, 0.48])
+
+    # Make the x and y axes logarithmic.
+    ax.set_xscale("log", base=2)
+    ax.set_yscale("log", base=2)
+    ax.xaxis.set_major_formatter(matplotlib.ticker.ScalarFormatter())
+    ax.yaxis.set_major_formatter(matplotlib.ticker.ScalarFormatter())
 
     # Initialize the GDP and electricity demand data to plot.
-    gdp_data_to_plot[alpha_3_code] = pandas.Series(dtype=float)
-    electricity_data_to_plot[alpha_3_code] = pandas.Series(dtype=float)
-
-    # Get the GDP and electricity demand data for the current alpha-3
-    # code with the longest available time range.
-    for code in local_codes:
-        local_gdp_data = gdp_data[alpha_3_code][code]
-        local_electricity_data = electricity_data[alpha_3_code][code]
-        if len(local_gdp_data) > len(gdp_data_to_plot[alpha_3_code]):
-            gdp_data_to_plot[alpha_3_code] = local_gdp_data
-        if len(local_electricity_data) > len(
-            electricity_data_to_plot[alpha_3_code]
-        ):
-            electricity_data_to_plot[alpha_3_code] = local_electricity_data
+    gdp_data_to_plot: dict[str, numpy.ndarray] = {}
+    electricity_data_to_plot: dict[str, numpy.ndarray] = {}
 
-    if (
-        not gdp_data_to_plot[alpha_3_code].empty
-        and not electricity_data_to_plot[alpha_3_code].empty
-    ):
-        # Make sure the GDP and electricity demand data are aligned by
-        # year.
-        common_index = gdp_data_to_plot[alpha_3_code].index.intersection(
-            electricity_data_to_plot[alpha_3_code].index
+    # Initialize the points to plot for each continent, as lists of GDP
+    # and electricity demand values.
+    points_by_continent: defaultdict[str, tuple[list[float], list[float]]] = (
+        defaultdict(lambda: ([], []))
+    )
+
+    # Group the codes of the countries and subdivisions by ISO alpha-3
+    # code once, so that the codes of each alpha-3 code are not searched
+    # for in the loop below.
+    codes_by_alpha_3_code: defaultdict[str, list[str]] = defaultdict(list)
+    for code in codes:
+        codes_by_alpha_3_code[alpha_3_codes[code]].append(code)
+
+    # Loop over the ISO alpha-3 codes and the codes belonging to them,
+    # and plot the data.
+    for alpha_3_code, local_codes in codes_by_alpha_3_code.items():
+        # Get the GDP and electricity demand data for the current
+        # alpha-3 code with the longest available time range.
+        longest_gdp_data = max(
+            (gdp_data[code] for code in local_codes),
+            key=len,
+            default=pandas.Series(dtype=float),
         )
-        gdp_data_to_plot[alpha_3_code] = gdp_data_to_plot[alpha_3_code][
-            common_index
-        ]
-        electricity_data_to_plot[alpha_3_code] = electricity_data_to_plot[
-            alpha_3_code
-        ][common_index]
-
-        # Get the the first and last values of the GDP and electricity
-        # demand data.
-        gdp_data_to_plot[alpha_3_code] = gdp_data_to_plot[alpha_3_code].iloc[
-            [0, -1]
-        ]
-        electricity_data_to_plot[alpha_3_code] = electricity_data_to_plot[
-            alpha_3_code
-        ].iloc[[0, -1]]
-
-        # Plot the of GDP per capita and annual electricity demand per
-        # capita data.
-        ax.plot(
-            gdp_data_to_plot[alpha_3_code] / 1000,
-            electricity_data_to_plot[alpha_3_code] / 1000,
-            "o",
+        longest_electricity_data = max(
+            (electricity_data[code] for code in local_codes),
+            key=len,
+            default=pandas.Series(dtype=float),
+        )
+
+        if not longest_gdp_data.empty and not longest_electricity_data.empty:
+            # Make sure the GDP and electricity demand data are aligned
+            # by year, and get their values in thousands.
+            common_index = longest_gdp_data.index.intersection(
+                longest_electricity_data.index
+            )
+            gdp_values = (
+                longest_gdp_data.reindex(common_index).to_numpy() / 1000
+            )
+            electricity_values = (
+                longest_electricity_data.reindex(common_index).to_numpy()
+                / 1000
+            )
+
+            # Get the the first and last values of the GDP and
+            # electricity demand data.
+            gdp_data_to_plot[alpha_3_code] = gdp_values[[0, -1]]
+            electricity_data_to_plot[alpha_3_code] = electricity_values[
+                [0, -1]
+            ]
+
+            # Store the GDP per capita and annual electricity demand per
+            # capita data to plot them by continent.
+            continent_code = continent_codes[local_codes[0]]
+            points_by_continent[continent_code][0].extend(
+                gdp_data_to_plot[alpha_3_code]
+            )
+            points_by_continent[continent_code][1].extend(
+                electricity_data_to_plot[alpha_3_code]
+            )
+
+            # Add an arrow from the first to the last point.
+            ax.annotate(
+                text="",
+                xy=(
+                    gdp_data_to_plot[alpha_3_code][1],
+                    electricity_data_to_plot[alpha_3_code][1],
+                ),
+                xytext=(
+                    gdp_data_to_plot[alpha_3_code][0],
+                    electricity_data_to_plot[alpha_3_code][0],
+                ),
+                arrowprops=dict(
+                    facecolor=colors[continent_code],
+                    edgecolor=(0, 0, 0, 0.7),
+                    linewidth=0.5,
+                    alpha=0.7,
+                ),
+            )
+
+    # Plot the GDP per capita and annual electricity demand per capita
+    # data of each continent at once.
+    for continent_code, points in points_by_continent.items():
+        ax.scatter(
+            points[0],
+            points[1],
+            s=100,
             alpha=0.7,
-            color=colors[continent_codes[local_codes[0]]],
-            markeredgecolor="none",
-            markersize=10,
-            label=continent_names[continent_codes[local_codes[0]]],
+            color=colors[continent_code],
+            edgecolors="none",
+            label=continent_names[continent_code],
         )
 
-        # Add an arrow from the first to the last point.
+    # Add sample points for the GDP and electricity demand data to
+    # explain the plot.
+    ax.plot(
+        [60, 110],
+        [0.3, 0.3],
+        "o",
+        alpha=0.7,
+        color=(0, 0, 0, 0.7),
+        markeredgecolor="none",
+        markersize=10,
+    )
+    ax.annotate(
+        text="",
+        xy=(110, 0.3),
+        xytext=(60, 0.3),
+        arrowprops=dict(
+            facecolor=(0, 0, 0, 0.5),
+            edgecolor=(0, 0, 0, 0.7),
+            linewidth=0.5,
+            alpha=0.7,
+        ),
+    )
+    ax.annotate(text="First year\nof data", xy=(60, 0.36), ha="center")
+    ax.annotate(text="Last year\nof data", xy=(110, 0.36), ha="center")
+
+    # Define the names of a few countries to add to the plot, with the
+    # ISO alpha-3 code, the factors to shift the label from the first
+    # point along the x and y axes, the alignment, and the continent
+    # code.
+    country_labels = [
+        ("Nigeria", "NGA", 1.08, 1.0, "left", "center", "AF"),
+        ("Peru", "PER", 1.1, 1.0, "left", "top", "SA"),
+        ("Colombia", "COL", 1.0, 1.13, "center", "bottom", "SA"),
+        ("Algeria", "DZA", 1.0, 0.9, "center", "top", "AF"),
+        ("Canada", "CAN", 1.05, 1.05, "left", "bottom", "NA"),
+        ("Norway", "NOR", 1.05, 0.94, "left", "top", "EU"),
+        ("Luxembourg", "LUX", 0.95, 1.08, "left", "bottom", "EU"),
+    ]
+
+    # Add the names of the countries to the plot.
+    for (
+        country_name,
+        alpha_3_code,
+        x_factor,
+        y_factor,
+        horizontal_alignment,
+        vertical_alignment,
+        continent_code,
+    ) in country_labels:
         ax.annotate(
-            text="",
+            text=country_name,
             xy=(
-                gdp_data_to_plot[alpha_3_code].iloc[1] / 1000,
-                electricity_data_to_plot[alpha_3_code].iloc[1] / 1000,
-            ),
-            xytext=(
-                gdp_data_to_plot[alpha_3_code].iloc[0] / 1000,
-                electricity_data_to_plot[alpha_3_code].iloc[0] / 1000,
-            ),
-            arrowprops=dict(
-                facecolor=colors[continent_codes[local_codes[0]]],
-                edgecolor=(0, 0, 0, 0.7),
-                linewidth=0.5,
-                alpha=0.7,
+                gdp_data_to_plot[alpha_3_code][0] * x_factor,
+                electricity_data_to_plot[alpha_3_code][0] * y_factor,
             ),
+            ha=horizontal_alignment,
+            va=vertical_alignment,
+            fontsize=12,
+            color=colors[continent_code],
         )
 
-# Add sample points for the GDP and electricity demand data to explain
-# the plot.
-ax.plot(
-    [60, 110],
-    [0.3, 0.3],
-    "o",
-    alpha=0.7,
-    color=(0, 0, 0, 0.7),
-    markeredgecolor="none",
-    markersize=10,
-)
-ax.annotate(
-    text="",
-    xy=(110, 0.3),
-    xytext=(60, 0.3),
-    arrowprops=dict(
-        facecolor=(0, 0, 0, 0.5),
-        edgecolor=(0, 0, 0, 0.7),
-        linewidth=0.5,
-        alpha=0.7,
-    ),
-)
-ax.annotate(text="First year\nof data", xy=(60, 0.36), ha="center")
-ax.annotate(text="Last year\nof data", xy=(110, 0.36), ha="center")
-
-# Add the names of a few countries to the plot.
-ax.annotate(
-    text="Nigeria",
-    xy=(
-        gdp_data_to_plot["NGA"].iloc[0] * 1.08 / 1000,
-        electricity_data_to_plot["NGA"].iloc[0] / 1000,
-    ),
-    ha="left",
-    va="center",
-    fontsize=12,
-    color=colors["AF"],
-)
-ax.annotate(
-    text="Peru",
-    xy=(
-        gdp_data_to_plot["PER"].iloc[0] * 1.1 / 1000,
-        electricity_data_to_plot["PER"].iloc[0] / 1000,
-    ),
-    ha="left",
-    va="top",
-    fontsize=12,
-    color=colors["SA"],
-)
-ax.annotate(
-    text="Colombia",
-    xy=(
-        gdp_data_to_plot["COL"].iloc[0] / 1000,
-        electricity_data_to_plot["COL"].iloc[0] * 1.13 / 1000,
-    ),
-    ha="center",
-    va="bottom",
-    fontsize=12,
-    color=colors["SA"],
-)
-ax.annotate(
-    "Algeria",
-    xy=(
-        gdp_data_to_plot["DZA"].iloc[0] / 1000,
-        electricity_data_to_plot["DZA"].iloc[0] * 0.9 / 1000,
-    ),
-    ha="center",
-    va="top",
-    fontsize=12,
-    color=colors["AF"],
-)
-ax.annotate(
-    text="Canada",
-    xy=(
-        gdp_data_to_plot["CAN"].iloc[0] * 1.05 / 1000,
-        electricity_data_to_plot["CAN"].iloc[0] * 1.05 / 1000,
-    ),
-    ha="left",
-    va="bottom",
-    fontsize=12,
-    color=colors["NA"],
-)
-ax.annotate(
-    text="Norway",
-    xy=(
-        gdp_data_to_plot["NOR"].iloc[0] * 1.05 / 1000,
-        electricity_data_to_plot["NOR"].iloc[0] * 0.94 / 1000,
-    ),
-    ha="left",
-    va="top",
-    fontsize=12,
-    color=colors["EU"],
-)
-ax.annotate(
-    text="Luxembourg",
-    xy=(
-        gdp_data_to_plot["LUX"].iloc[0] * 0.95 / 1000,
-        electricity_data_to_plot["LUX"].iloc[0] * 1.08 / 1000,
-    ),
-    ha="left",
-    va="bottom",
-    fontsize=12,
-    color=colors["EU"],
-)
-
-# Add a legend to the plot.
-for count, continent_code in enumerate(continent_names.keys()):
-    ax.add_patch(
-        matplotlib.patches.Rectangle(
-            (
-                0.02,
-                0.925 - 0.25 * (count) / (len(continent_names.values()) - 1),
+    # Add a legend to the plot.
+    for count, continent_code in enumerate(continent_names.keys()):
+        ax.add_patch(
+            matplotlib.patches.Rectangle(
+                (
+                    0.02,
+                    0.925
+                    - 0.25 * (count) / (len(continent_names.values()) - 1),
+                ),
+                0.19,
+                0.05,
+                facecolor=colors[continent_code],
+                edgecolor="none",
+                alpha=0.7,
+                transform=ax.transAxes,
+            )
+        )
+        ax.annotate(
+            text=continent_names[continent_code],
+            xy=(
+                0.03,
+                0.94 - 0.25 * (count) / (len(continent_names.values()) - 1),
             ),
-            0.19,
-            0.05,
-            facecolor=colors[continent_code],
-            edgecolor="none",
-            alpha=0.7,
-            transform=ax.transAxes,
+            xycoords="axes fraction",
+            color=(0, 0, 0, 1),
+            fontsize=14,
         )
+
+    # Add the axis titles.
+    ax.set_xlabel(
+        "GDP per capita, PPP (current international k$)", fontsize=14
     )
-    ax.annotate(
-        text=continent_names[continent_code],
-        xy=(0.03, 0.94 - 0.25 * (count) / (len(continent_names.values()) - 1)),
-        xycoords="axes fraction",
-        color=(0, 0, 0, 1),
-        fontsize=14,
+    ax.set_ylabel("Annual electricity demand per capita (MWh)", fontsize=14)
+
+    # Add a title to the figure.
+    matplotlib.pyplot.suptitle(
+        (
+            "Availability of hourly and sub-hourly electricity demand data\n"
+            "by GDP and annual electricity demand per capita"
+        ),
+        x=0.45,
+        y=1.02,
+        fontsize=18,
+        weight="bold",
     )
 
-# Add the axis titles.
-ax.set_xlabel("GDP per capita, PPP (current international k$)", fontsize=14)
-ax.set_ylabel("Annual electricity demand per capita (MWh)", fontsize=14)
-
-# Add a title to the figure.
-matplotlib.pyplot.suptitle(
-    (
-        "Availability of hourly and sub-hourly electricity demand data\n"
-        "by GDP and annual electricity demand per capita"
-    ),
-    x=0.45,
-    y=1.02,
-    fontsize=18,
-    weight="bold",
-)
-
-# Save the figure.
-fig.savefig(
-    os.path.join(
-        figure_directory, "data_availability_by_gpd_and_electricity_demand.png"
-    ),
-    dpi=300,
-    bbox_inches="tight",
-)
+    # Save the figure.
+    fig.savefig(
+        os.path.join(
+            figure_directory,
+            "data_availability_by_gpd_and_electricity_demand.png",
+        ),
+        dpi=300,
+        bbox_inches="tight",
+    )
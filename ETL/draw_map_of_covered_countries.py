@@ -15,9 +15,11 @@ import os
 
 import cartopy.crs
 import cartopy.feature
+import geopandas
 import matplotlib.cm
 import matplotlib.colors
 import matplotlib.pyplot
+import numpy
 import utils.directories
 import utils.entities
 import utils.shapes
@@ -58,38 +60,8 @@ alpha = 0.8
 lower_bound = 0.2
 upper_bound = 0.9
 
-# Loop over the countries.
-for code in codes:
-    # Get the shape of the country or subdivision.
-    entity_shape = utils.shapes.get_entity_shape(code, make_plot=False)
-
-    # Calculate the number of years of available data.
-    n_years = (date_ranges[code][1] - date_ranges[code][0]).days / 365
-
-    # Define the transparency of the shape based on the number of years
-    # of available data.
-    if n_years >= 0 and n_years < 5:
-        color = map_cmap(lower_bound)
-    elif n_years >= 5 and n_years < 10:
-        color = map_cmap(lower_bound + (upper_bound - lower_bound) / 3)
-    elif n_years >= 10 and n_years < 20:
-        color = map_cmap(lower_bound + (2 * (upper_bound - lower_bound)) / 3)
-    else:
-        color = map_cmap(upper_bound)
-
-    # Plot the country or subdivision.
-    entity_shape.plot(
-        ax=ax,
-        transform=data_crs,
-        facecolor=color,
-        edgecolor="black",
-        linewidth=0.5,
-        aspect=None,
-        autolim=False,
-        alpha=alpha,
-    )
-
-# Extract the base colors of the colormap.
+# Extract the base colors of the colormap for the levels of years of
+# available data.
 base_colors = [
     map_cmap(lower_bound),
     map_cmap(lower_bound + (upper_bound - lower_bound) / 3),
@@ -97,6 +69,45 @@ base_colors = [
     map_cmap(upper_bound),
 ]
 
+# Calculate the number of years of available data of all countries and
+# subdivisions, and get their level (0-4, 5-9, 10-19, and 20+ years).
+n_years = numpy.array(
+    [
+        (date_ranges[code][1] - date_ranges[code][0]).days / 365
+        for code in codes
+    ]
+)
+year_levels = numpy.digitize(n_years, [5, 10, 20])
+
+# Combine the shapes of all countries and subdivisions into a single
+# GeoDataFrame, so that they are drawn with a single call.
+entity_shapes = geopandas.GeoDataFrame(
+    geometry=[
+        utils.shapes.get_entity_shape(code, make_plot=False).union_all()
+        for code in codes
+    ],
+    index=codes,
+    crs=4326,
+)
+
+# Simplify the shapes to drop the vertices that are finer than the
+# resolution of the figure. A tolerance of 0.05 degrees (about 5 km) is
+# below the size of a pixel of the saved map.
+entity_shapes.geometry = entity_shapes.geometry.simplify(0.05)
+
+# Plot the countries and subdivisions with the color of their level of
+# years of available data.
+entity_shapes.plot(
+    ax=ax,
+    transform=data_crs,
+    color=numpy.array(base_colors)[year_levels],
+    edgecolor="black",
+    linewidth=0.5,
+    aspect=None,
+    autolim=False,
+    alpha=alpha,
+)
+
 # Modify the transparency of the base colors.
 base_colors = [
     (base_colors[0][0], base_colors[0][1], base_colors[0][2], alpha),
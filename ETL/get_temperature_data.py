@@ -13,17 +13,25 @@ Description:
     code is provided, the script will use all available codes. The year
     of the weather data can be specified as a command line argument. If
     no year is provided, the script will use all the years of available
-    electricity demand data.
+    electricity demand data. The results can also be saved in a CSV
+    file.
 """
 
 import argparse
+import concurrent.futures
 import datetime
+import functools
+import glob
 import logging
 import os
+import tempfile
+import zoneinfo
 
 import geopandas
 import numpy
 import pandas
+import pyarrow
+import pyarrow.parquet
 import utils.directories
 import utils.entities
 import utils.geospatial
@@ -31,6 +39,12 @@ import utils.shapes
 import xarray
 from tqdm import tqdm
 
+# Avoid HDF5 file locking, which can fail when the temperature and
+# population density files are opened by several processes. It is set
+# when the script is imported, so before the HDF5 library is loaded in
+# the current process and in the worker processes.
+os.environ["HDF5_USE_FILE_LOCKING"] = "FALSE"
+
 
 def read_command_line_arguments() -> argparse.Namespace:
     """
@@ -99,6 +113,24 @@ def read_command_line_arguments() -> argparse.Namespace:
         ),
         required=False,
     )
+    parser.add_argument(
+        "-e",
+        "--emit_csv",
+        help="Whether to also save the data as a CSV file.",
+        action="store_true",
+        required=False,
+    )
+    parser.add_argument(
+        "-w",
+        "--max_workers",
+        type=int,
+        default=4,
+        help=(
+            "The maximum number of countries and subdivisions processed at "
+            "once. Each process loads the weather data of a whole year."
+        ),
+        required=False,
+    )
 
     # Read the arguments from the command line.
     args = parser.parse_args()
@@ -106,77 +138,64 @@ def read_command_line_arguments() -> argparse.Namespace:
     return args
 
 
-def get_temperature_in_largest_population_density_areas(
-    year: int,
-    entity_shape: geopandas.GeoDataFrame,
-    entity_time_zone: datetime.tzinfo,
-    number_of_grid_cells: int = 1,
-) -> pandas.Series:
+def get_population_density_year(year: int) -> int:
     """
-    Get the temperature data for the largest population density areas.
+    Get the year of the population density data to use.
 
-    This function reads the temperature data downloaded from the
-    Copernicus Climate Data Store (CDS) for the given year and extracts
-    the temperature data for the largest population density areas in the
-    given country or subdivision. The temperature data is averaged over
-    the grid cells with the largest population densities.
+    This function returns the year of available population density
+    data that is closest to the given year.
 
     Parameters
     ----------
     year : int
         The year of the temperature data.
-    entity_shape : geopandas.GeoDataFrame
-        The shape of the country or subdivision of interest.
-    entity_time_zone : datetime.tzinfo
-        Time zone of the country or subdivision of interest.
-    number_of_grid_cells : int, optional
-        The number of grid cells to consider.
 
     Returns
     -------
-    pandas.Series
-        Temperature data for the largest population density areas in the
-        given country or subdivision.
+    int
+        The year of the population density data.
     """
-    # Read the temperature data downloaded from the Copernicus Climate
-    # Data Store (CDS).
-    temperature_data_directory = utils.directories.read_folders_structure()[
-        "weather_folder"
-    ]
-    temperature_data = xarray.open_mfdataset(
-        os.path.join(
-            temperature_data_directory,
-            f"{entity_shape.index[0]}_2m_temperature_*.nc",
-        )
-    )
-
-    # Harmonize the temperature data.
-    temperature_data = utils.geospatial.harmonize_coords(temperature_data)
-
-    # Extract the temperature data for the given year in local time.
-    start_date = (
-        pandas.Timestamp(str(year) + "-01-01 00:00:00", tz=entity_time_zone)
-        .tz_convert("UTC")
-        .tz_localize(None)
-    )
-    end_date = (
-        pandas.Timestamp(str(year) + "-12-31 23:59:59", tz=entity_time_zone)
-        .tz_convert("UTC")
-        .tz_localize(None)
-    )
-    temperature_data = temperature_data.sel(
-        valid_time=slice(start_date, end_date)
-    )["t2m"].load()
-
     # Define the years for which population density data is available.
     available_years = numpy.array([2020])  # TO UPDATE
 
     # Find the year of the population density data that is closest to
     # the year of the temperature data.
-    population_density_year = available_years[
-        numpy.abs(available_years - year).argmin()
-    ]
+    return int(available_years[numpy.abs(available_years - year).argmin()])
+
+
+def get_largest_population_density_coordinates(
+    entity_shape: geopandas.GeoDataFrame,
+    population_density_year: int,
+    number_of_grid_cells: int = 1,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Get the coordinates of the largest population density areas.
+
+    This function reads the population density data of the given
+    country or subdivision and returns the coordinates of the grid
+    cells with the largest population densities in its shape. The
+    coordinates only depend on the shape and the year of the population
+    density data, so they can be reused for all years of temperature
+    data.
+
+    Parameters
+    ----------
+    entity_shape : geopandas.GeoDataFrame
+        The shape of the country or subdivision of interest.
+    population_density_year : int
+        The year of the population density data.
+    number_of_grid_cells : int, optional
+        The number of grid cells to consider.
 
+    Returns
+    -------
+    x_coords : numpy.ndarray
+        The x coordinates of the grid cells with the largest population
+        densities, sorted by increasing population density.
+    y_coords : numpy.ndarray
+        The y coordinates of the grid cells with the largest population
+        densities, sorted by increasing population density.
+    """
     # Read the population density data of the country or subdivision of
     # interest.
     population_density_directory = utils.directories.read_folders_structure()[
@@ -200,24 +219,248 @@ def get_temperature_in_largest_population_density_areas(
     # Fix roundig errors in the coordinates of the grid cells.
     x_coords = largest_population_densities["x"].round(2).to_numpy()
     y_coords = largest_population_densities["y"].round(2).to_numpy()
-    temperature_data["x"] = temperature_data["x"].round(2)
-    temperature_data["y"] = temperature_data["y"].round(2)
+
+    return x_coords, y_coords
+
+
+def read_temperature_data(code: str) -> xarray.DataArray:
+    """
+    Read the temperature data of a country or subdivision.
+
+    This function opens the temperature data downloaded from the
+    Copernicus Climate Data Store (CDS) for all years of the given
+    country or subdivision. The data is opened lazily, so that it can
+    be read once and then sliced for each year of interest.
+
+    Parameters
+    ----------
+    code : str
+        The code of the country or subdivision of interest.
+
+    Returns
+    -------
+    temperature_data : xarray.DataArray
+        The temperature data of the country or subdivision, with
+        harmonized coordinates.
+    """
+    # Get the files of temperature data downloaded from the Copernicus
+    # Climate Data Store (CDS) for all years.
+    temperature_data_directory = utils.directories.read_folders_structure()[
+        "weather_folder"
+    ]
+    temperature_file_paths = sorted(
+        glob.glob(
+            os.path.join(
+                temperature_data_directory, f"{code}_2m_temperature_*.nc"
+            )
+        )
+    )
+
+    if len(temperature_file_paths) == 1:
+        # Open the single file directly, as there is nothing to combine.
+        temperature_data = xarray.open_dataset(
+            temperature_file_paths[0], engine="h5netcdf"
+        )["t2m"]
+    else:
+        # Open the files in parallel with the h5netcdf engine and only
+        # concatenate the variables that depend on time. The chunks
+        # follow the chunks stored in the files, so that the selection
+        # of a year and of a few grid cells only reads the chunks that
+        # contain them.
+        temperature_data = xarray.open_mfdataset(
+            temperature_file_paths,
+            engine="h5netcdf",
+            chunks={},
+            parallel=True,
+            data_vars="minimal",
+            coords="minimal",
+            compat="override",
+        )["t2m"]
+
+    # Harmonize the temperature data.
+    temperature_data = utils.geospatial.harmonize_coords(temperature_data)
+
+    # Fix roundig errors in the coordinates of the temperature data.
+    return temperature_data.assign_coords(
+        x=temperature_data["x"].round(2), y=temperature_data["y"].round(2)
+    )
+
+
+def get_temperature_in_largest_population_density_areas(
+    year: int,
+    temperature_data: xarray.DataArray,
+    entity_time_zone: datetime.tzinfo,
+    x_coords: numpy.ndarray,
+    y_coords: numpy.ndarray,
+) -> tuple[pandas.Series, pandas.Series]:
+    """
+    Get the temperature data for the largest population density areas.
+
+    This function extracts the temperature data of the given year for
+    the largest population density areas in the given country or
+    subdivision. The data of the year is loaded once, only for the
+    given grid cells, and used for both the grid cell with the largest
+    population density and the average over all given grid cells.
+
+    Parameters
+    ----------
+    year : int
+        The year of the temperature data.
+    temperature_data : xarray.DataArray
+        The temperature data of the country or subdivision of interest,
+        as returned by read_temperature_data.
+    entity_time_zone : datetime.tzinfo
+        Time zone of the country or subdivision of interest.
+    x_coords : numpy.ndarray
+        The x coordinates of the grid cells with the largest population
+        densities, sorted by increasing population density.
+    y_coords : numpy.ndarray
+        The y coordinates of the grid cells with the largest population
+        densities, sorted by increasing population density. Each grid
+        cell is given by the x and y coordinates at the same position.
+
+    Returns
+    -------
+    temperature_in_largest_population_density : pandas.Series
+        Temperature data for the largest population density area in the
+        given country or subdivision.
+    average_temperature_in_largest_population_densities : pandas.Series
+        Temperature data averaged over the largest population density
+        areas in the given country or subdivision.
+    """
+    # Get the start and end dates of the given year in local time and
+    # convert them to UTC. The time zone is read by name, so that the
+    # offset of each date is resolved correctly for any tzinfo object.
+    local_time_zone = zoneinfo.ZoneInfo(str(entity_time_zone))
+    start_date = (
+        datetime.datetime(year, 1, 1, tzinfo=local_time_zone)
+        .astimezone(datetime.UTC)
+        .replace(tzinfo=None)
+    )
+    end_date = (
+        datetime.datetime(year, 12, 31, 23, 59, 59, tzinfo=local_time_zone)
+        .astimezone(datetime.UTC)
+        .replace(tzinfo=None)
+    )
+
+    # Load only the grid cells of interest, so that the data outside of
+    # them is not read from the files, and keep them in single
+    # precision, as the temperature columns are stored. The few chunks
+    # are loaded in the current process, which already runs in parallel
+    # with the other entities, without starting a thread pool.
+    temperature_data = (
+        temperature_data.sel(
+            valid_time=slice(start_date, end_date),
+            y=numpy.unique(y_coords),
+            x=numpy.unique(x_coords),
+        )
+        .load(scheduler="synchronous")
+        .astype(numpy.float32, copy=False)
+    )
+
+    # Get the time index of the temperature data.
+    time_index = temperature_data["valid_time"].to_index()
+
+    # If there are no grid cells with valid population densities, return
+    # missing temperature values for all time steps.
+    if len(y_coords) == 0:
+        missing_temperature = pandas.Series(
+            numpy.nan, index=time_index, name=temperature_data.name
+        )
+        return missing_temperature, missing_temperature.copy()
+
+    # Get the positions of the grid cells with the largest population
+    # densities in the loaded temperature data.
+    y_indices = temperature_data.get_index("y").get_indexer(y_coords)
+    x_indices = temperature_data.get_index("x").get_indexer(x_coords)
 
     # Get the temperature data for the grid cells with the largest
-    # population densities.
-    temperature_in_largest_population_densities = temperature_data.sel(
-        y=y_coords,
-        x=x_coords,
+    # population densities, with one row per time step and one column
+    # per grid cell. Each grid cell is given by a pair of coordinates.
+    temperature_in_largest_population_densities = temperature_data.transpose(
+        "valid_time", "y", "x"
+    ).to_numpy()[:, y_indices, x_indices]
+
+    # Get the temperature data for the grid cell with the largest
+    # population density, which is the last of the given grid cells.
+    temperature_in_largest_population_density = (
+        temperature_in_largest_population_densities[:, -1]
     )
 
     # Calculate the average temperature for the grid cells with the
-    # largest population densities.
-    average_temperature_in_largest_population_densities = (
-        temperature_in_largest_population_densities.mean(dim=("y", "x"))
+    # largest population densities in double precision.
+    average_temperature_in_largest_population_densities = numpy.nanmean(
+        temperature_in_largest_population_densities,
+        axis=1,
+        dtype=numpy.float64,
+    )
+
+    # Convert the temperature data to pandas Series and return them.
+    return (
+        pandas.Series(
+            temperature_in_largest_population_density,
+            index=time_index,
+            name=temperature_data.name,
+        ),
+        pandas.Series(
+            average_temperature_in_largest_population_densities,
+            index=time_index,
+            name=temperature_data.name,
+        ),
+    )
+
+
+@functools.cache
+def get_temperature_database_schema() -> pyarrow.Schema:
+    """
+    Get the schema of the temperature database.
+
+    This function returns the Arrow schema of the temperature database,
+    which is the same for all countries, subdivisions, and years. It is
+    used to write the database to parquet files without inferring the
+    schema each time.
+
+    Returns
+    -------
+    pyarrow.Schema
+        The schema of the temperature database.
+    """
+    # Define an empty temperature database with the data types of its
+    # columns and index.
+    temperature_database = pandas.DataFrame(
+        {
+            "Local hour of the day": pandas.Series(dtype="int8"),
+            "Local weekend indicator": pandas.Series(dtype="int8"),
+            "Local month of the year": pandas.Series(dtype="int8"),
+            "Local year": pandas.Series(dtype="int16"),
+            "Temperature - Top 1 (K)": pandas.Series(dtype="float32"),
+            "Temperature - Top 3 (K)": pandas.Series(dtype="float32"),
+            "Monthly average temperature - Top 1 (K)": pandas.Series(
+                dtype="float32"
+            ),
+            "Monthly average temperature rank - Top 1": pandas.Series(
+                dtype="float64"
+            ),
+            "Annual average temperature - Top 1 (K)": pandas.Series(
+                dtype="float32"
+            ),
+            "5 percentile temperature - Top 1 (K)": pandas.Series(
+                dtype="float32"
+            ),
+            "95 percentile temperature - Top 1 (K)": pandas.Series(
+                dtype="float32"
+            ),
+        },
+        index=pandas.DatetimeIndex(
+            [], dtype="datetime64[ns]", name="Time (UTC)"
+        ),
     )
 
-    # Convert the temperature data to a pandas Series and return it.
-    return average_temperature_in_largest_population_densities.to_series()
+    # Get the schema of the temperature database, including the pandas
+    # metadata that restores its index when it is read.
+    return pyarrow.Schema.from_pandas(
+        temperature_database, preserve_index=True
+    )
 
 
 def build_temperature_database(
@@ -258,75 +501,86 @@ def build_temperature_database(
         index=temperature_time_series_top_1.index
     )
 
-    # Convert the temperature time series to the local time zone.
-    temperature_time_series_top_1 = temperature_time_series_top_1.tz_localize(
-        "UTC"
-    ).tz_convert(entity_time_zone)
-    temperature_time_series_top_3 = temperature_time_series_top_3.tz_localize(
-        "UTC"
-    ).tz_convert(entity_time_zone)
-
-    # Get the montly average temperature.
-    monthly_average_temperature = temperature_time_series_top_1.resample(
-        "ME"
-    ).mean()
-    monthly_average_temperature.index = monthly_average_temperature.index.month
-
-    # Get the rank of the monthly average temperature.
-    monthly_average_temperature_rank = monthly_average_temperature.rank(
-        ascending=False
+    # Get the local time of each time step. Only the time index is
+    # converted, as the values of the time series are the same in any
+    # time zone.
+    local_times = (
+        temperature_time_series_top_1.index.tz_localize("UTC")
+        .tz_convert(entity_time_zone)
+        .tz_localize(None)
+        .to_numpy()
+    )
+
+    # Decompose the local time of each time step into days, months, and
+    # years since the Unix epoch in a single pass over the times.
+    local_days = local_times.astype("datetime64[D]")
+    local_months = local_times.astype("datetime64[M]").astype(numpy.int64)
+
+    # Get the local hour of the day, month of the year, and year, with
+    # the smallest integer types that fit them.
+    local_hour = (
+        (local_times - local_days) // numpy.timedelta64(1, "h")
+    ).astype(numpy.int8)
+    local_month = (local_months % 12 + 1).astype(numpy.int8)
+    local_year = (local_months // 12 + 1970).astype(numpy.int16)
+
+    # Get the local day of the week, starting from Monday, knowing that
+    # the Unix epoch (1970-01-01) was a Thursday.
+    local_day_of_the_week = (local_days.astype(numpy.int64) + 3) % 7
+
+    # Get the index of the month of each time step.
+    month_indices = local_month - 1
+
+    # Get the temperature values of the time series, which covers a
+    # single year, in double precision for the statistics.
+    temperature_values_top_1 = temperature_time_series_top_1.to_numpy(
+        dtype=numpy.float64
+    )
+
+    # Get the monthly average temperature from the sum and the number
+    # of non-missing temperature values in each month of the year.
+    temperature_is_available = ~numpy.isnan(temperature_values_top_1)
+    monthly_temperature_sum = numpy.bincount(
+        month_indices,
+        weights=numpy.where(
+            temperature_is_available, temperature_values_top_1, 0
+        ),
+        minlength=12,
     )
-
-    # Map the monthly average temperature to the original temperature
-    # time series.
-    monthly_average_temperature = (
-        temperature_time_series_top_1.index.month.map(
-            monthly_average_temperature
-        ).to_series()
+    monthly_number_of_values = numpy.bincount(
+        month_indices, weights=temperature_is_available, minlength=12
+    )
+    monthly_average_temperature = numpy.full(12, numpy.nan)
+    numpy.divide(
+        monthly_temperature_sum,
+        monthly_number_of_values,
+        out=monthly_average_temperature,
+        where=monthly_number_of_values > 0,
     )
-    monthly_average_temperature.index = temperature_time_series_top_1.index
 
-    # Map the monthly average temperature rank to the original
-    # temperature time series.
+    # Get the rank of the monthly average temperature.
     monthly_average_temperature_rank = (
-        temperature_time_series_top_1.index.month.map(
-            monthly_average_temperature_rank
-        ).to_series()
-    )
-    monthly_average_temperature_rank.index = (
-        temperature_time_series_top_1.index
+        pandas.Series(monthly_average_temperature)
+        .rank(ascending=False)
+        .to_numpy()
     )
 
     # Get the annual average temperature.
-    annual_average_temperature = pandas.Series(
-        temperature_time_series_top_1.resample("YE").mean().to_numpy()[0],
-        index=temperature_time_series_top_1.index,
-    )
+    annual_average_temperature = float(numpy.nanmean(temperature_values_top_1))
 
     # Get the 5 and 95 percentiles of the temperature.
-    temperature_5_percentile = pandas.Series(
-        temperature_time_series_top_1.quantile(0.05),
-        index=temperature_time_series_top_1.index,
-    )
-    temperature_95_percentile = pandas.Series(
-        temperature_time_series_top_1.quantile(0.95),
-        index=temperature_time_series_top_1.index,
+    temperature_5_percentile, temperature_95_percentile = numpy.nanquantile(
+        temperature_values_top_1, [0.05, 0.95]
     )
 
     # Add the hour of the day, day of the week, month of the year, and
     # year to the DataFrame.
-    temperature_database["Local hour of the day"] = (
-        temperature_time_series_top_1.index.hour
-    )
+    temperature_database["Local hour of the day"] = local_hour
     temperature_database["Local weekend indicator"] = (
-        temperature_time_series_top_1.index.dayofweek >= 5
-    ).astype(int)
-    temperature_database["Local month of the year"] = (
-        temperature_time_series_top_1.index.month
-    )
-    temperature_database["Local year"] = (
-        temperature_time_series_top_1.index.year
-    )
+        local_day_of_the_week >= 5
+    ).astype(numpy.int8)
+    temperature_database["Local month of the year"] = local_month
+    temperature_database["Local year"] = local_year
 
     # Add the temperature statistics to the temperature time series.
     temperature_database["Temperature - Top 1 (K)"] = (
@@ -336,25 +590,322 @@ def build_temperature_database(
         temperature_time_series_top_3.to_numpy()
     )
     temperature_database["Monthly average temperature - Top 1 (K)"] = (
-        monthly_average_temperature.to_numpy()
+        monthly_average_temperature[month_indices]
     )
     temperature_database["Monthly average temperature rank - Top 1"] = (
-        monthly_average_temperature_rank.to_numpy()
+        monthly_average_temperature_rank[month_indices]
     )
     temperature_database["Annual average temperature - Top 1 (K)"] = (
-        annual_average_temperature.to_numpy()
+        annual_average_temperature
     )
     temperature_database["5 percentile temperature - Top 1 (K)"] = (
-        temperature_5_percentile.to_numpy()
+        temperature_5_percentile
     )
     temperature_database["95 percentile temperature - Top 1 (K)"] = (
-        temperature_95_percentile.to_numpy()
+        temperature_95_percentile
     )
     temperature_database.index.name = "Time (UTC)"
 
+    # Store the temperature columns in single precision, which is more
+    # than enough for the precision of the temperature data.
+    temperature_columns = [
+        column for column in temperature_database.columns if "(K)" in column
+    ]
+    temperature_database[temperature_columns] = temperature_database[
+        temperature_columns
+    ].astype(numpy.float32)
+
     return temperature_database
 
 
+def read_stored_row_groups(file_path: str) -> dict[int, int]:
+    """
+    Read the row groups of the years stored in a temperature file.
+
+    This function reads the metadata of the parquet file of temperature
+    time series of a country or subdivision, where the data of each year
+    is stored in its own row group, and returns the row group of each
+    year.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the parquet file of temperature time series.
+
+    Returns
+    -------
+    dict[int, int]
+        The index of the row group of each stored year. It is empty if
+        the file does not exist.
+    """
+    # Check if the file exists.
+    if not os.path.exists(file_path):
+        return {}
+
+    # Read the metadata of the file.
+    metadata = pyarrow.parquet.read_metadata(file_path)
+
+    # Get the local year of each row group from the statistics of the
+    # local year column, which is constant within a row group.
+    year_column_index = metadata.schema.to_arrow_schema().get_field_index(
+        "Local year"
+    )
+    return {
+        metadata.row_group(row_group_index)
+        .column(year_column_index)
+        .statistics.min: row_group_index
+        for row_group_index in range(metadata.num_row_groups)
+    }
+
+
+def process_entity(
+    code: str, args: argparse.Namespace, result_directory: str
+) -> None:
+    """
+    Extract the temperature data of a country or subdivision.
+
+    This function extracts the temperature data for the largest
+    population density areas in the given country or subdivision for
+    all years of interest and saves the results in the given directory.
+    The years without temperature data or whose extraction fails are
+    logged and left out, so that the other years are still saved.
+
+    Parameters
+    ----------
+    code : str
+        The code of the country or subdivision of interest.
+    args : argparse.Namespace
+        The command line arguments.
+    result_directory : str
+        The directory where the temperature time series are saved.
+    """
+    logging.info(f"Extracting temperature data for {code}.")
+
+    if args.year is not None:
+        # If the year is provided, use it.
+        years = [args.year]
+    else:
+        # Get the years of available data for the country or
+        # subdivision of interest.
+        years = utils.entities.get_available_years(code)
+
+        # Filter years based on minimum and maximum if provided
+        if args.year_minimum is not None:
+            years = [year for year in years if year >= args.year_minimum]
+        if args.year_maximum is not None:
+            years = [year for year in years if year <= args.year_maximum]
+    # Get the shape of the country or subdivision.
+    entity_shape = utils.shapes.get_entity_shape(code, make_plot=False)
+
+    # Get the time zone information for the country or subdivision.
+    entity_time_zone = utils.entities.get_time_zone(code)
+
+    # Initialize the coordinates of the grid cells with the 3
+    # largest population densities for each year of population
+    # density data. They are only read when needed and then reused
+    # for all years of temperature data.
+    coordinates_top_3: dict[int, tuple[numpy.ndarray, numpy.ndarray]] = {}
+
+    # Initialize the temperature data of the country or subdivision.
+    # It is opened when first needed and reused for all years.
+    temperature_data: xarray.DataArray | None = None
+
+    # Get the current year, for which the temperature data may still be
+    # incomplete.
+    current_year = datetime.date.today().year
+
+    # Define the file path of the temperature time series, which stores
+    # the data of each year in its own row group.
+    file_path = os.path.join(
+        result_directory, f"{code}_temperature_time_series.parquet"
+    )
+
+    # Get the row groups of the years that are already stored.
+    stored_row_groups = read_stored_row_groups(file_path)
+
+    # Get the years for which the temperature time series has not been
+    # stored yet or is for the current year.
+    years_to_extract = [
+        year
+        for year in years
+        if year not in stored_row_groups or year == current_year
+    ]
+
+    if len(years_to_extract) == 0:
+        logging.info(f"Temperature time series for {code} already exists.")
+        return
+
+    # Get the schema of the temperature database.
+    temperature_database_schema = get_temperature_database_schema()
+
+    # Read the row groups of the stored years, opening the stored file
+    # only once. The stored row group of a year that is extracted again
+    # is kept if the extraction fails.
+    stored_tables = {}
+    if len(stored_row_groups) > 0:
+        with pyarrow.parquet.ParquetFile(file_path) as stored_file:
+            stored_tables = {
+                year: stored_file.read_row_group(row_group_index)
+                for year, row_group_index in stored_row_groups.items()
+            }
+
+    # Initialize the list of years for which the extraction failed.
+    failed_years = []
+
+    # Write the stored and the new years to a temporary file, which
+    # replaces the file of temperature time series once complete. The
+    # temporary file does not have the parquet extension, so that it is
+    # never taken for a file of temperature time series.
+    temporary_file_descriptor, temporary_file_path = tempfile.mkstemp(
+        dir=result_directory, suffix=".tmp"
+    )
+    try:
+        with (
+            open(temporary_file_descriptor, "wb") as temporary_file,
+            pyarrow.parquet.ParquetWriter(
+                temporary_file,
+                temperature_database_schema,
+                compression="zstd",
+                compression_level=3,
+                use_byte_stream_split=[
+                    field.name
+                    for field in temperature_database_schema
+                    if pyarrow.types.is_floating(field.type)
+                ],
+            ) as parquet_writer,
+        ):
+            # Loop over the stored and the new years.
+            for year in sorted(set(stored_row_groups) | set(years_to_extract)):
+                logging.info(f"Year {year}.")
+
+                if year not in years_to_extract:
+                    # Copy the row group of the year from the stored
+                    # file.
+                    parquet_writer.write_table(stored_tables[year])
+                    continue
+
+                try:
+                    # Get the coordinates of the 3 largest population
+                    # density areas, if they have not been read for the
+                    # year of the population density data yet.
+                    population_density_year = get_population_density_year(year)
+                    if population_density_year not in coordinates_top_3:
+                        coordinates_top_3[population_density_year] = (
+                            get_largest_population_density_coordinates(
+                                entity_shape,
+                                population_density_year,
+                                number_of_grid_cells=3,
+                            )
+                        )
+
+                    # Open the temperature data of the country or
+                    # subdivision, if it has not been opened yet.
+                    if temperature_data is None:
+                        temperature_data = read_temperature_data(code)
+
+                    # Get the temperature data for the largest and the 3
+                    # largest population density areas in the given
+                    # country or subdivision.
+                    (
+                        temperature_time_series_top_1,
+                        temperature_time_series_top_3,
+                    ) = get_temperature_in_largest_population_density_areas(
+                        year,
+                        temperature_data,
+                        entity_time_zone,
+                        *coordinates_top_3[population_density_year],
+                    )
+
+                    # Skip the year if there is no temperature data for
+                    # it, such as early in the current year.
+                    if len(temperature_time_series_top_1) == 0:
+                        logging.warning(
+                            f"No temperature data for {code} in {year}."
+                        )
+                        temperature_database = None
+                    else:
+                        # Add temperature statistics to the time series.
+                        temperature_database = build_temperature_database(
+                            temperature_time_series_top_1,
+                            temperature_time_series_top_3,
+                            entity_time_zone,
+                        )
+                except Exception as e:
+                    # Log the error and continue with the next year, so
+                    # that the other years are still saved.
+                    logging.error(
+                        f"Error extracting temperature data for {code} "
+                        f"in {year}: {e}"
+                    )
+                    failed_years.append(year)
+                    temperature_database = None
+
+                if temperature_database is None:
+                    # Keep the stored row group of the year, if any.
+                    if year in stored_tables:
+                        parquet_writer.write_table(stored_tables[year])
+                    continue
+
+                # Write the temperature time series of the year as a
+                # single row group.
+                parquet_writer.write_table(
+                    pyarrow.Table.from_pandas(
+                        temperature_database,
+                        schema=temperature_database_schema,
+                        preserve_index=True,
+                    ),
+                    row_group_size=len(temperature_database),
+                )
+                if args.emit_csv:
+                    temperature_database.to_csv(
+                        file_path.replace(".parquet", f"_{year}.csv")
+                    )
+    except Exception:
+        # Remove the incomplete temporary file before raising the error.
+        os.remove(temporary_file_path)
+        raise
+
+    # Replace the file of temperature time series.
+    os.replace(temporary_file_path, file_path)
+
+    if len(failed_years) > 0:
+        logging.warning(
+            f"Temperature time series for {code} has been saved without "
+            f"the years {failed_years}."
+        )
+    else:
+        logging.info(
+            f"Temperature time series for {code} has been successfully "
+            "extracted and saved."
+        )
+
+
+def configure_worker_logging(log_file_path: str | None) -> None:
+    """
+    Set up the logging configuration of a worker process.
+
+    This function is run at the start of each worker process. Worker
+    processes that are spawned instead of forked do not inherit the
+    logging configuration of the main process, so their log records
+    are appended to the log file of the main process.
+
+    Parameters
+    ----------
+    log_file_path : str | None
+        The path to the log file of the main process. If None, the
+        logging configuration is left unchanged.
+    """
+    if log_file_path is not None:
+        # Append the log records to the log file of the main process.
+        # This has no effect if the logging configuration was inherited.
+        logging.basicConfig(
+            filename=log_file_path,
+            level=logging.INFO,
+            filemode="a",
+            format="%(asctime)s - %(levelname)s - %(message)s",
+        )
+
+
 def run_temperature_calculation(args: argparse.Namespace) -> None:
     """
     Run the calculation of the temperature data.
@@ -380,88 +931,38 @@ def run_temperature_calculation(args: argparse.Namespace) -> None:
         code=args.code, file_path=args.file
     )
 
-    # Loop over the countries and subdivisions of interest.
-    for code in tqdm(codes, desc="Processing entities"):
-        logging.info(f"Extracting temperature data for {code}.")
-
-        if args.year is not None:
-            # If the year is provided, use it.
-            years = [args.year]
-        else:
-            # Get the years of available data for the country or
-            # subdivision of interest.
-            years = utils.entities.get_available_years(code)
-
-            # Filter years based on minimum and maximum if provided
-            if args.year_minimum is not None:
-                years = [year for year in years if year >= args.year_minimum]
-            if args.year_maximum is not None:
-                years = [year for year in years if year <= args.year_maximum]
-        # Get the shape of the country or subdivision.
-        entity_shape = utils.shapes.get_entity_shape(code, make_plot=False)
-
-        # Get the time zone information for the country or subdivision.
-        entity_time_zone = utils.entities.get_time_zone(code)
-
-        # Loop over the years.
-        for year in years:
-            logging.info(f"Year {year}.")
-
-            # Define the file paths of the temperature time series.
-            file_path = os.path.join(
-                result_directory,
-                f"{code}_temperature_time_series_{year}.parquet",
+    # Get the log file of the current process, if any, so that the
+    # worker processes write their log records to the same file.
+    log_file_path = next(
+        (
+            handler.baseFilename
+            for handler in logging.getLogger().handlers
+            if isinstance(handler, logging.FileHandler)
+        ),
+        None,
+    )
+
+    # Process the countries and subdivisions of interest in parallel,
+    # as they are independent of each other.
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=args.max_workers,
+        initializer=configure_worker_logging,
+        initargs=(log_file_path,),
+    ) as executor:
+        list(
+            tqdm(
+                executor.map(
+                    functools.partial(
+                        process_entity,
+                        args=args,
+                        result_directory=result_directory,
+                    ),
+                    codes,
+                ),
+                total=len(codes),
+                desc="Processing entities",
             )
-
-            # Check if the file of temperature time series for the
-            # largest population density area does not exist.
-            if not os.path.exists(file_path) or (
-                os.path.exists(file_path)
-                and year == pandas.Timestamp.now().year
-            ):
-                # Get the temperature data for the largest population
-                # density area in the given country or subdivision.
-                temperature_time_series_top_1 = (
-                    get_temperature_in_largest_population_density_areas(
-                        year,
-                        entity_shape,
-                        entity_time_zone,
-                        number_of_grid_cells=1,
-                    )
-                )
-
-                # Get the temperature data for the 3 largest population
-                # density areas in the given country or subdivision.
-                temperature_time_series_top_3 = (
-                    get_temperature_in_largest_population_density_areas(
-                        year,
-                        entity_shape,
-                        entity_time_zone,
-                        number_of_grid_cells=3,
-                    )
-                )
-
-                # Add temperature statistics to the time series.
-                temperature_database = build_temperature_database(
-                    temperature_time_series_top_1,
-                    temperature_time_series_top_3,
-                    entity_time_zone,
-                )
-
-                # Save the temperature time series.
-                temperature_database.to_parquet(file_path)
-                temperature_database.to_csv(
-                    file_path.replace(".parquet", ".csv")
-                )
-
-                logging.info(
-                    f"Temperature time series for {code} has been "
-                    "successfully extracted and saved."
-                )
-            else:
-                logging.info(
-                    f"Temperature time series for {code} already exists."
-                )
+        )
 
 
 if __name__ == "__main__":
@@ -13,9 +13,10 @@ Description:
     Source: https://www.bchydro.com/energy-in-bc/operations/transmission/transmission-system/balancing-authority-load-data/historical-transmission-data.html
 """  # noqa: W505
 
+import datetime
 import logging
+import time
 
-import numpy
 import pandas
 import utils.entities
 import utils.fetcher
@@ -209,6 +210,81 @@ def _get_excel_information(
     return rows_to_skip, header, index_columns, load_column
 
 
+def get_time_steps(
+    dates: pandas.Series, hours_ending: pandas.Series
+) -> pandas.DatetimeIndex:
+    """
+    Get the time steps of the electricity demand data.
+
+    This function constructs the time steps from the local date and the
+    hour ending of each row of the Excel files. The hour that is
+    repeated when the daylight saving time ends is taken first in
+    daylight saving time and then in standard time. The hour that is
+    skipped when the daylight saving time starts has no time step.
+
+    Parameters
+    ----------
+    dates : pandas.Series
+        The local date of each row.
+    hours_ending : pandas.Series
+        The hour ending of each row, from 1 to 24.
+
+    Returns
+    -------
+    pandas.DatetimeIndex
+        The time steps at the end of each hour in local time, with NaT
+        for the hour skipped when the daylight saving time starts.
+    """
+    # Get the local time at the beginning of each hour, so that the
+    # hour ending 24 is still on the date of its row.
+    local_times = pandas.DatetimeIndex(
+        pandas.to_datetime(dates)
+        + pandas.to_timedelta(hours_ending.astype(int) - 1, unit="h")
+    )
+
+    # Localize the beginning of each hour. The first occurrence of a
+    # repeated hour is in daylight saving time, and a nonexistent hour
+    # is set to NaT, so that it does not overlap with the next hour.
+    # Then move the time steps to the end of each hour.
+    return local_times.tz_localize(
+        "America/Vancouver",
+        ambiguous=local_times.duplicated(keep="last"),
+        nonexistent="NaT",
+    ) + pandas.Timedelta("1h")
+
+
+def _get_cache_max_age(year: int) -> float:
+    """
+    Get the maximum age of the cached copy of the Excel file of a year.
+
+    The Excel file of a year does not change anymore after the end of
+    the year, so a copy downloaded after the end of the year is always
+    reused. A copy downloaded before is reused for one day at most, so
+    that the data of the rest of the year is retrieved.
+
+    Parameters
+    ----------
+    year : int
+        The year of the electricity demand data.
+
+    Returns
+    -------
+    float
+        The maximum age in seconds of the cached copy of the file.
+    """
+    # Get the time elapsed since the end of the year.
+    time_since_end_of_year = (
+        time.time() - datetime.datetime(year + 1, 1, 1).timestamp()
+    )
+
+    # If the year is over, only a copy downloaded after its end is
+    # younger than the time elapsed since then.
+    if time_since_end_of_year > 0:
+        return time_since_end_of_year
+    else:
+        return 86400
+
+
 def download_and_extract_data_for_request(year: int) -> pandas.Series:
     """
     Download and extract electricity demand data.
@@ -244,7 +320,19 @@ def download_and_extract_data_for_request(year: int) -> pandas.Series:
         year
     )
 
-    # Fetch HTML content from the URL.
+    # Define the maximum number of rows to read, which is the number of
+    # hours in the year (from April for 2001) plus a margin for the
+    # daylight saving time switch. This avoids parsing the trailing
+    # rows of the Excel file.
+    first_day_of_data = datetime.date(year, 4 if year == 2001 else 1, 1)
+    rows_to_read = (
+        24 * (datetime.date(year + 1, 1, 1) - first_day_of_data).days + 50
+    )
+
+    # Fetch the Excel file from the URL. The files of past years do not
+    # change anymore, so their cached copy is always reused if it was
+    # downloaded after the end of the year, while the file of the
+    # current year is downloaded again once a day.
     dataset = utils.fetcher.fetch_data(
         url,
         "excel",
@@ -252,7 +340,9 @@ def download_and_extract_data_for_request(year: int) -> pandas.Series:
             "skiprows": rows_to_skip,
             "header": header,
             "usecols": index_columns + load_column,
+            "nrows": rows_to_read,
         },
+        cache_max_age=_get_cache_max_age(year),
     )
 
     # Make sure the dataset is a pandas DataFrame.
@@ -262,43 +352,24 @@ def download_and_extract_data_for_request(year: int) -> pandas.Series:
             "expected a pandas DataFrame."
         )
     else:
-        # Extract the first and last time steps of the electricity
-        # demand time series.
-        first_time_step = pandas.to_datetime(
-            str(dataset[index_columns[0]].iloc[0])
-            + " "
-            + str(int(dataset[index_columns[1]].iloc[0]) - 1)
-            + ":00"
-        ) + pandas.Timedelta("1h")
-        last_time_step = pandas.to_datetime(
-            str(dataset[index_columns[0]].iloc[-1])
-            + " "
-            + str(int(dataset[index_columns[1]].iloc[-1]) - 1)
-            + ":00"
-        ) + pandas.Timedelta("1h")
-
-        # Remove NaN and zero values where daylight saving time switch
-        # occurs. The other data points are typically nice and clean.
-        available_data = dataset[load_column[0]][
-            (
-                numpy.logical_and(
-                    dataset[load_column[0]] != 0,
-                    dataset[load_column[0]].notna(),
-                )
-            )
-        ]
-
-        # Construct the index of the electricity demand time series.
-        timestamps = pandas.date_range(
-            start=first_time_step,
-            end=last_time_step,
-            freq="h",
-            tz="America/Vancouver",
-        )
+        # Remove the rows without date or hour, such as the empty rows
+        # at the end of the Excel file, and the NaN and zero values
+        # where the daylight saving time switch occurs.
+        dataset = dataset.dropna(subset=index_columns + load_column)
+        dataset = dataset[dataset[load_column[0]] != 0]
 
         # Extract the electricity demand time series.
         electricity_demand_time_series = pandas.Series(
-            available_data.values, index=timestamps
+            dataset[load_column[0]].to_numpy(),
+            index=get_time_steps(
+                dataset[index_columns[0]], dataset[index_columns[1]]
+            ),
         )
 
+        # Remove the values of the hour that is skipped when the
+        # daylight saving time starts.
+        electricity_demand_time_series = electricity_demand_time_series[
+            electricity_demand_time_series.index.notna()
+        ]
+
         return electricity_demand_time_series
@@ -121,6 +121,7 @@ def get_url(
     start_date: pandas.Timestamp,
     end_date: pandas.Timestamp,
     code: str,
+    offset: int = 0,
 ) -> str:
     """
     Get the URL of the electricity demand data on the EIA website.
@@ -133,6 +134,9 @@ def get_url(
         The end date of the data retrieval.
     code : str
         The code of the subdivision of interest.
+    offset : int, optional
+        The number of data points to skip, used to retrieve the pages
+        of the data after the first one.
 
     Returns
     -------
@@ -176,7 +180,8 @@ def get_url(
         f"api_key={api_key}&facets[type][]=D&"
         f"facets[respondent][]={subdivision_code}&"
         f"start={start}&end={end}&frequency=hourly&data[0]=value&"
-        "sort[0][column]=period&sort[0][direction]=asc&offset=0&length=5000"
+        "sort[0][column]=period&sort[0][direction]=asc&"
+        f"offset={offset}&length=5000"
     )
 
 
@@ -218,29 +223,48 @@ def download_and_extract_data_for_request(
         f"{start_date.date()} to {end_date.date()}."
     )
 
-    # Get the URL of the electricity demand data.
-    url = get_url(start_date, end_date, code)
+    # Fetch the pages of the electricity demand data. The API returns
+    # at most 5000 data points per page, so the next page is requested
+    # until a page contains fewer data points.
+    datasets = []
+    offset = 0
+    while True:
+        # Get the URL of the current page of the electricity demand
+        # data.
+        url = get_url(start_date, end_date, code, offset=offset)
+
+        # Fetch the electricity demand data from the URL.
+        dataset = utils.fetcher.fetch_data(
+            url,
+            "html",
+            read_with="requests.get",
+            read_as="json",
+            json_keys=["response", "data"],
+        )
 
-    # Fetch the electricity demand data from the URL.
-    dataset = utils.fetcher.fetch_data(
-        url,
-        "html",
-        read_with="requests.get",
-        read_as="json",
-        json_keys=["response", "data"],
-    )
+        # Make sure the dataset is a pandas DataFrame.
+        if not isinstance(dataset, pandas.DataFrame):
+            raise ValueError(
+                f"The extracted data is a {type(dataset)} object, "
+                "expected a pandas DataFrame."
+            )
 
-    # Make sure the dataset is a pandas DataFrame.
-    if not isinstance(dataset, pandas.DataFrame):
-        raise ValueError(
-            f"The extracted data is a {type(dataset)} object, "
-            "expected a pandas DataFrame."
-        )
-    else:
-        # Create the electricity demand time series.
-        electricity_demand_time_series = pandas.Series(
-            dataset["value"].values,
-            index=pandas.to_datetime(dataset["period"]),
-        ).tz_localize("UTC")
-
-        return electricity_demand_time_series
+        datasets.append(dataset)
+
+        # Stop if this is the last page.
+        if len(dataset) < 5000:
+            break
+        offset += 5000
+
+    # Concatenate the pages of the electricity demand data.
+    dataset = pandas.concat(datasets, ignore_index=True)
+
+    # Create the electricity demand time series.
+    electricity_demand_time_series = pandas.Series(
+        dataset["value"].to_numpy(),
+        index=pandas.to_datetime(
+            dataset["period"].to_numpy(), format="%Y-%m-%dT%H"
+        ),
+    ).tz_localize("UTC")
+
+    return electricity_demand_time_series
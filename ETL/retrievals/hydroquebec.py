@@ -81,8 +81,13 @@ def download_and_extract_data() -> pandas.Series:
     # Get the URL of the electricity demand data.
     url = get_url()
 
-    # Fetch the electricity demand data.
-    electricity_demand_time_series = utils.fetcher.fetch_data(url, "csv")
+    # Fetch the electricity demand data, reusing the copy downloaded
+    # within the last day. The pyarrow engine reads the file in
+    # parallel and usually parses the dates with their UTC offsets
+    # into UTC timestamps already.
+    electricity_demand_time_series = utils.fetcher.fetch_data(
+        url, "csv", csv_kwargs={"engine": "pyarrow"}, cache_max_age=86400
+    )
 
     # Make sure the dataset is a pandas DataFrame.
     if not isinstance(electricity_demand_time_series, pandas.DataFrame):
@@ -99,16 +104,21 @@ def download_and_extract_data() -> pandas.Series:
             ).squeeze()
         )
 
-        # Convert the index to a datetime object.
+        # Convert the index to a datetime object. This is a no-op if
+        # the dates were already parsed into UTC timestamps. If a
+        # malformed or empty cell left them as strings, they are parsed
+        # here and an error is raised for the malformed ones.
         electricity_demand_time_series.index = pandas.to_datetime(
             electricity_demand_time_series.index,
             format="%Y-%m-%dT%H:%M:%S%z",
             utc=True,
         )
 
-        # Sort the index.
-        electricity_demand_time_series = (
-            electricity_demand_time_series.sort_index()
-        )
+        # Sort the index if the data is not already in chronological
+        # order.
+        if not electricity_demand_time_series.index.is_monotonic_increasing:
+            electricity_demand_time_series = (
+                electricity_demand_time_series.sort_index()
+            )
 
         return electricity_demand_time_series
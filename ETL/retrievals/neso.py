@@ -170,7 +170,7 @@ def download_and_extract_data_for_request(year: int) -> pandas.Series:
     else:
         # Extract the electricity demand time series.
         electricity_demand_time_series = pandas.Series(
-            dataset["ND"].values,
+            dataset["ND"].to_numpy(),
             index=pandas.date_range(
                 start=f"{year}-01-01 00:30",
                 periods=len(dataset),
@@ -189,15 +189,12 @@ def download_and_extract_data_for_request(
         # Initialize the list to store the daily values.
         dayly_values_list = []
 
-        # Iterate over the dates in the dataset.
-        for date in dataset["Date"]:
-            # Extract the row corresponding to the date.
-            values_dict = dataset[dataset["Date"] == date]
-
+        # Iterate over the dates and the respective values in the
+        # dataset, without searching the row of each date.
+        for date, values_dict in zip(dataset["Date"], dataset["Values"]):
             # Extract the values for each hour of the day.
             hourly_values = [
-                (values_dict["Values"].to_numpy()[0])[f"Hour{hour:02d}"]
-                for hour in range(1, 25)
+                values_dict[f"Hour{hour:02d}"] for hour in range(1, 25)
             ]
 
             # Define the date and time for each hour of the day.
@@ -56,8 +56,7 @@ region_codes = {
 }
 
 # Add the codes to the regions shapefile.
-for region_name in regions.index:
-    regions.loc[region_name, "EIAcode"] = region_codes[region_name]
+regions["EIAcode"] = regions.index.map(region_codes)
 
 # Select the columns of interest.
 regions = regions[["EIAcode", "geometry"]]
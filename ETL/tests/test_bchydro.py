@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+License: AGPL-3.0.
+
+Description:
+
+    This file contains unit tests for the bchydro module in the ETL
+    retrieval package.
+"""
+
+import datetime
+from unittest.mock import patch
+
+import pandas
+from retrievals.bchydro import _get_cache_max_age, get_time_steps
+
+
+def test_get_time_steps_in_spring():
+    """
+    Test if the function handles the start of the daylight saving time.
+
+    This test checks that the hours before and after the skipped hour
+    of the daylight saving time switch in spring are consecutive in UTC.
+    """
+    # Define the hours ending of the day of the switch, where the hour
+    # ending 3 does not exist.
+    time_steps = get_time_steps(
+        pandas.Series(["2023-03-12"] * 3), pandas.Series([1, 2, 4])
+    )
+
+    # Check that the time steps are consecutive hours in UTC.
+    assert time_steps.tz_convert("UTC").equals(
+        pandas.date_range("2023-03-12 09:00", periods=3, freq="h", tz="UTC")
+    )
+
+
+def test_get_time_steps_with_the_skipped_hour():
+    """
+    Test if the function discards the skipped hour in spring.
+
+    This test checks that the hour ending 3, which does not exist on
+    the day of the daylight saving time switch in spring, has no time
+    step, so that it does not overlap with the hour ending 4.
+    """
+    # Define the hours ending of the day of the switch, including the
+    # nonexistent hour ending 3.
+    time_steps = get_time_steps(
+        pandas.Series(["2023-03-12"] * 4), pandas.Series([1, 2, 3, 4])
+    )
+
+    # Check that the nonexistent hour has no time step.
+    assert time_steps.isna().tolist() == [False, False, True, False]
+
+    # Check that the other time steps are consecutive hours in UTC.
+    existing_time_steps = time_steps.dropna()
+    assert existing_time_steps.tz_convert("UTC").equals(
+        pandas.date_range("2023-03-12 09:00", periods=3, freq="h", tz="UTC")
+    )
+
+
+def test_get_time_steps_in_autumn():
+    """
+    Test if the function handles the end of the daylight saving time.
+
+    This test checks that the repeated hour of the daylight saving time
+    switch in autumn is kept twice, first in daylight saving time and
+    then in standard time, and that the hours are consecutive in UTC.
+    """
+    # Define the hours ending of the day of the switch, where the hour
+    # ending 2 is repeated.
+    time_steps = get_time_steps(
+        pandas.Series(["2023-11-05"] * 4), pandas.Series([1, 2, 2, 3])
+    )
+
+    # Check that the time steps are consecutive hours in UTC.
+    assert time_steps.tz_convert("UTC").equals(
+        pandas.date_range("2023-11-05 08:00", periods=4, freq="h", tz="UTC")
+    )
+
+
+def test_get_time_steps_at_the_end_of_the_year():
+    """
+    Test if the function sets the hour ending 24 at the end of the day.
+
+    This test checks that the last hour of the year ends at midnight of
+    the next day.
+    """
+    # Define the last hour of the year.
+    time_steps = get_time_steps(
+        pandas.Series(["2023-12-31"]), pandas.Series([24])
+    )
+
+    # Check that the time step is at midnight of the next day.
+    assert time_steps[0] == pandas.Timestamp(
+        "2024-01-01 00:00", tz="America/Vancouver"
+    )
+
+
+def test_get_cache_max_age_after_the_end_of_the_year():
+    """
+    Test if the cached copy of a year is refreshed after the year ends.
+
+    This test checks that the copy of the file of a year is downloaded
+    again once a day during the year, that a copy downloaded before the
+    end of the year is too old after it, and that a copy downloaded
+    after the end of the year is always reused.
+    """
+    # Define the download time of the copies and the current time.
+    download_in_december = datetime.datetime(2025, 12, 15).timestamp()
+    download_in_january = datetime.datetime(2026, 1, 1, 12).timestamp()
+    current_time = datetime.datetime(2026, 1, 2).timestamp()
+
+    # Get the maximum age of the copies of 2025 and 2026.
+    with patch("retrievals.bchydro.time.time", return_value=current_time):
+        cache_max_age_2025 = _get_cache_max_age(2025)
+        cache_max_age_2026 = _get_cache_max_age(2026)
+
+    # Check that the file of the current year is downloaded once a day.
+    assert cache_max_age_2026 == 86400
+
+    # Check that the copy of 2025 downloaded in December is too old.
+    assert current_time - download_in_december > cache_max_age_2025
+
+    # Check that the copy of 2025 downloaded in January is reused.
+    assert current_time - download_in_january <= cache_max_age_2025
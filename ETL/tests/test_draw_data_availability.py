@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+License: AGPL-3.0.
+
+Description:
+
+    This file contains unit tests for the helper functions of the
+    script drawing the availability of electricity demand data.
+"""
+
+import datetime
+from unittest.mock import patch
+
+import numpy
+import pandas
+import pytest
+from draw_data_availability import (
+    _bin_occurrences,
+    _extract_entity_data,
+    _flatten_year_fractions,
+    _get_electricity_demand_data,
+    _get_year_fractions,
+)
+
+
+@pytest.fixture
+def sample_dataset():
+    """
+    Fixture to provide a sample annual dataset for testing.
+
+    This function creates a pandas DataFrame with ISO alpha-3 codes as
+    index and years as columns, with a missing value.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A DataFrame with ISO alpha-3 codes as index and years as
+        columns.
+    """
+    return pandas.DataFrame(
+        {"2020": [1.0, 10.0], "2021": [numpy.nan, 20.0], "2022": [3.0, 30.0]},
+        index=["AAA", "BBB"],
+    )
+
+
+def test_get_year_fractions():
+    """
+    Test if the function calculates the fractions of years correctly.
+
+    This test checks the fractions of partial years, of leap years, and
+    of the years divisible by 100 that are not leap years.
+    """
+    # Define the time ranges of the data, starting in the middle of a
+    # year, covering a leap year, and covering the year 1900.
+    fractions_of_years = _get_year_fractions(
+        ["AA", "BB"],
+        {
+            "AA": (datetime.date(2023, 7, 1), datetime.date(2024, 12, 31)),
+            "BB": (datetime.date(1900, 1, 1), datetime.date(1900, 12, 31)),
+        },
+    )
+
+    # Check that the fractions of years are correct.
+    assert fractions_of_years["AA"] == {"2023": 184 / 365, "2024": 1.0}
+    assert fractions_of_years["BB"] == {"1900": 1.0}
+
+
+def test_flatten_year_fractions():
+    """
+    Test if the function flattens the fractions of years correctly.
+
+    This test checks that the entity indices, years, and fractions of
+    years are parallel and follow the order of the codes.
+    """
+    # Flatten the fractions of years of two entities.
+    entity_indices, years, fractions = _flatten_year_fractions(
+        ["BB", "AA"],
+        {"AA": {"2023": 0.5, "2024": 1.0}, "BB": {"2020": 0.25}},
+    )
+
+    # Check that the arrays are parallel and in the order of the codes.
+    assert entity_indices.tolist() == [0, 1, 1]
+    assert years.tolist() == ["2020", "2023", "2024"]
+    assert fractions.tolist() == [0.25, 0.5, 1.0]
+
+
+def test_bin_occurrences():
+    """
+    Test if the function sums the fractions of years in each level.
+
+    This test checks that values on the edge between two levels fall in
+    the upper level, that values in the last level without an upper
+    bound are counted, and that values below the first edge or missing
+    are not counted.
+    """
+    # Define the values, the fractions of years, and the continents.
+    values = numpy.array([-1.0, 0.0, 2000.0, 4999.0, 1e9, numpy.nan])
+    fractions = numpy.array([1.0, 0.5, 0.25, 1.0, 0.75, 1.0])
+    continent_ids = numpy.array([0, 0, 1, 1, 0, 1])
+
+    # Sum the fractions of years in two continents and three levels.
+    occurrences = _bin_occurrences(
+        values,
+        fractions,
+        continent_ids,
+        numpy.array([0, 2000, 5000, float("inf")]),
+        2,
+    )
+
+    # Check that the occurrences are correct.
+    assert occurrences.tolist() == [[0.5, 0.0, 0.75], [0.0, 1.25, 0.0]]
+
+
+def test_extract_entity_data(sample_dataset):
+    """
+    Test if the function extracts the data of the entities correctly.
+
+    This test checks that subdivisions of the same country get the data
+    of the country, and that missing values, missing years, and missing
+    countries are dropped.
+    """
+    # Extract the data of two subdivisions of the same country, and of a
+    # country that is not in the dataset.
+    extracted_data = _extract_entity_data(
+        sample_dataset,
+        ["AA_1", "AA_2", "CC"],
+        {"AA_1": "AAA", "AA_2": "AAA", "CC": "CCC"},
+        {
+            "AA_1": ["2020", "2021", "2023"],
+            "AA_2": ["2022"],
+            "CC": ["2020"],
+        },
+    )
+
+    # Check that only the available data is extracted.
+    assert extracted_data["AA_1"].to_dict() == {"2020": 1.0}
+    assert extracted_data["AA_2"].to_dict() == {"2022": 3.0}
+    assert extracted_data["CC"].empty
+
+
+def test_get_electricity_demand_data(sample_dataset):
+    """
+    Test if the function combines the Ember and World Bank data.
+
+    This test checks that the values of the two datasets are averaged
+    when both are available, and that the available value is used
+    otherwise.
+    """
+    # Define the Ember data, with a country that is not in the World
+    # Bank data.
+    ember_data = pandas.DataFrame(
+        {"2020": [3.0, numpy.nan], "2021": [4.0, 50.0]},
+        index=["AAA", "CCC"],
+    )
+
+    # Get the combined electricity demand data.
+    with (
+        patch(
+            "draw_data_availability._retrieve_ember_electricity_data",
+            return_value=ember_data,
+        ),
+        patch(
+            "draw_data_availability._retrieve_world_bank_data",
+            return_value=sample_dataset,
+        ),
+    ):
+        electricity_data = _get_electricity_demand_data(
+            ["AA", "BB", "CC"],
+            {"AA": "AAA", "BB": "BBB", "CC": "CCC"},
+            {code: ["2020", "2021", "2022"] for code in ["AA", "BB", "CC"]},
+        )
+
+    # Check that the data of both sources are averaged when available.
+    assert electricity_data["AA"].to_dict() == {
+        "2020": 2.0,
+        "2021": 4.0,
+        "2022": 3.0,
+    }
+
+    # Check that the data of a single source is used otherwise.
+    assert electricity_data["BB"].to_dict() == {
+        "2020": 10.0,
+        "2021": 20.0,
+        "2022": 30.0,
+    }
+    assert electricity_data["CC"].to_dict() == {"2021": 50.0}
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+License: AGPL-3.0.
+
+Description:
+
+    This file contains unit tests for the eia module in the ETL
+    retrieval package.
+"""
+
+from unittest.mock import patch
+
+import pandas
+import pytest
+from retrievals.eia import download_and_extract_data_for_request
+
+
+def _get_pages(number_of_data_points):
+    """
+    Get the pages of a sample response of the EIA API.
+
+    Parameters
+    ----------
+    number_of_data_points : int
+        The total number of data points of the response.
+
+    Returns
+    -------
+    dict[str, pandas.DataFrame]
+        A dictionary where the keys are the URLs of the pages and the
+        values are the data of the pages, with at most 5000 data points
+        each.
+    """
+    # Define the hourly data points of the response.
+    dataset = pandas.DataFrame(
+        {
+            "period": pandas.date_range(
+                "2023-01-01", periods=number_of_data_points, freq="h"
+            ).strftime("%Y-%m-%dT%H"),
+            "value": range(number_of_data_points),
+        }
+    )
+
+    # Split the data points into pages, with an empty page after the
+    # last full page, as returned by the API.
+    return {
+        f"offset={offset}": (
+            dataset.iloc[offset : offset + 5000].reset_index(drop=True)
+            if offset < number_of_data_points
+            else pandas.DataFrame([])
+        )
+        for offset in range(0, number_of_data_points + 1, 5000)
+    }
+
+
+@pytest.mark.parametrize(
+    "number_of_data_points, expected_offsets",
+    [(4999, [0]), (5000, [0, 5000]), (5001, [0, 5000])],
+)
+def test_download_and_extract_data_for_request(
+    number_of_data_points, expected_offsets
+):
+    """
+    Test if the function retrieves all the pages of the data.
+
+    This test checks that the next page is requested only when a page
+    contains 5000 data points, and that the data points of all the pages
+    are combined in order.
+
+    Parameters
+    ----------
+    number_of_data_points : int
+        The total number of data points of the response.
+    expected_offsets : list[int]
+        The offsets of the pages that are expected to be requested.
+    """
+    # Define the pages of the response.
+    pages = _get_pages(number_of_data_points)
+
+    # Retrieve the data with the pages of the sample response.
+    with (
+        patch("retrievals.eia._check_input_parameters"),
+        patch(
+            "retrievals.eia.get_url",
+            side_effect=lambda *args, offset: f"offset={offset}",
+        ) as get_url,
+        patch(
+            "utils.fetcher.fetch_data",
+            side_effect=lambda url, *args, **kwargs: pages[url],
+        ),
+    ):
+        electricity_demand_time_series = download_and_extract_data_for_request(
+            pandas.Timestamp("2023-01-01"),
+            pandas.Timestamp("2023-07-01"),
+            "US",
+        )
+
+    # Check that the expected pages are requested.
+    assert [
+        call.kwargs["offset"] for call in get_url.call_args_list
+    ] == expected_offsets
+
+    # Check that all the data points are retrieved in order.
+    assert electricity_demand_time_series.tolist() == list(
+        range(number_of_data_points)
+    )
+    assert electricity_demand_time_series.index.equals(
+        pandas.date_range(
+            "2023-01-01", periods=number_of_data_points, freq="h", tz="UTC"
+        )
+    )
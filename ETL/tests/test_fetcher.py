@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+License: AGPL-3.0.
+
+Description:
+
+    This file contains unit tests for the fetcher module in the ETL
+    utility package.
+"""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from utils.fetcher import _fetch_cached_content
+
+
+@pytest.fixture
+def sample_session():
+    """
+    Fixture to provide a sample HTTP session for testing.
+
+    This function creates a mock of the session used to send the HTTP
+    requests, which returns a fixed content for any URL.
+
+    Returns
+    -------
+    unittest.mock.MagicMock
+        A mock of the HTTP session.
+    """
+    # Define the response of the session.
+    session = MagicMock()
+    session.get.return_value.content = b"sample content"
+
+    return session
+
+
+def _fetch(url, cache_max_age, session, cache_directory):
+    """
+    Fetch the content of a file with a given session and cache folder.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the file.
+    cache_max_age : float
+        The maximum age in seconds of the cached copy of the file.
+    session : unittest.mock.MagicMock
+        The mock of the HTTP session.
+    cache_directory : str
+        The folder of the cached copies of the files.
+
+    Returns
+    -------
+    BytesIO
+        The content of the file.
+    """
+    with (
+        patch("utils.fetcher._get_session", return_value=session),
+        patch(
+            "utils.directories.read_folders_structure",
+            return_value={"download_cache_folder": str(cache_directory)},
+        ),
+    ):
+        return _fetch_cached_content(url, cache_max_age)
+
+
+def test_fetch_cached_content(sample_session, tmp_path):
+    """
+    Test if the function downloads a file only once.
+
+    This test checks that the file is downloaded on the first call, and
+    that the cached copy is returned on the second call.
+    """
+    # Fetch the same file twice.
+    first_content = _fetch("https://a.b/c", 3600, sample_session, tmp_path)
+    second_content = _fetch("https://a.b/c", 3600, sample_session, tmp_path)
+
+    # Check that the file is downloaded only once.
+    assert sample_session.get.call_count == 1
+
+    # Check that the content is the same in both calls.
+    assert first_content.read() == b"sample content"
+    assert second_content.read() == b"sample content"
+
+    # Check that only the cached copy is left in the cache folder.
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_fetch_cached_content_when_expired(sample_session, tmp_path):
+    """
+    Test if the function downloads a file again when the copy is old.
+
+    This test checks that the file is downloaded again if the cached
+    copy is older than the maximum age.
+    """
+    # Fetch the file once.
+    _fetch("https://a.b/c", 3600, sample_session, tmp_path)
+
+    # Make the cached copy older than the maximum age.
+    cache_file_path = os.path.join(tmp_path, os.listdir(tmp_path)[0])
+    old_time = time.time() - 7200
+    os.utime(cache_file_path, (old_time, old_time))
+
+    # Fetch the file again with new content.
+    sample_session.get.return_value.content = b"new content"
+    content = _fetch("https://a.b/c", 3600, sample_session, tmp_path)
+
+    # Check that the file is downloaded again.
+    assert sample_session.get.call_count == 2
+    assert content.read() == b"new content"
+
+
+def test_fetch_cached_content_when_failed(sample_session, tmp_path):
+    """
+    Test if the function does not cache a failed download.
+
+    This test checks that an error of the download is raised and that
+    nothing is left in the cache folder.
+    """
+    # Make the download fail.
+    sample_session.get.return_value.raise_for_status.side_effect = (
+        requests.exceptions.HTTPError("404 Client Error")
+    )
+
+    # Check that the error is raised.
+    with pytest.raises(requests.exceptions.HTTPError):
+        _fetch("https://a.b/c", 3600, sample_session, tmp_path)
+
+    # Check that nothing is left in the cache folder.
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+License: AGPL-3.0.
+
+Description:
+
+    This file contains unit tests for the geospatial module in the ETL
+    utility package.
+"""
+
+from unittest.mock import patch
+
+import numpy
+import pytest
+import xarray
+from utils.geospatial import get_largest_values_in_shape
+
+
+@pytest.fixture
+def sample_xarray_data():
+    """
+    Fixture to provide sample gridded data for testing.
+
+    This function creates a 3x4 grid of distinct values, with a missing
+    value in the first grid cell.
+
+    Returns
+    -------
+    xarray.DataArray
+        A 3x4 grid of values with "y" and "x" coordinates.
+    """
+    # Define the values of the grid, with a missing value.
+    values = numpy.array(
+        [
+            [numpy.nan, 5.0, 2.0, 9.0],
+            [7.0, 1.0, 11.0, 3.0],
+            [4.0, 8.0, 6.0, 10.0],
+        ]
+    )
+
+    return xarray.DataArray(
+        values,
+        dims=("y", "x"),
+        coords={"y": [0.0, 0.25, 0.5], "x": [0.0, 0.25, 0.5, 0.75]},
+    )
+
+
+def _get_largest_values(xarray_data, fraction_in_shape, number_of_grid_cells):
+    """
+    Get the largest values with a given fraction of cells in the shape.
+
+    Parameters
+    ----------
+    xarray_data : xarray.DataArray
+        The gridded data.
+    fraction_in_shape : xarray.DataArray
+        The fraction of each grid cell that is in the shape.
+    number_of_grid_cells : int
+        The number of grid cells to get.
+
+    Returns
+    -------
+    xarray.DataArray
+        The grid cells with the largest values.
+    """
+    with patch(
+        "utils.geospatial.get_fraction_of_grid_cells_in_shape",
+        return_value=fraction_in_shape,
+    ):
+        return get_largest_values_in_shape(
+            None, xarray_data, number_of_grid_cells
+        )
+
+
+def test_get_largest_values_in_shape(sample_xarray_data):
+    """
+    Test if the function returns the largest values in ascending order.
+
+    This test checks that the function returns the same grid cells as
+    sorting all the values in the shape, with the largest value last.
+
+    Parameters
+    ----------
+    sample_xarray_data : xarray.DataArray
+        A 3x4 grid of values with "y" and "x" coordinates.
+    """
+    # Consider all grid cells to be in the shape.
+    largest_values = _get_largest_values(
+        sample_xarray_data, xarray.ones_like(sample_xarray_data), 3
+    )
+
+    # Check that the grid cells are the same as the last grid cells of
+    # all the values in the shape sorted in ascending order.
+    stacked_data = sample_xarray_data.stack(z=("y", "x")).dropna(dim="z")
+    assert largest_values.equals(stacked_data.sortby(stacked_data).tail(z=3))
+    assert largest_values.to_numpy().tolist() == [9.0, 10.0, 11.0]
+
+
+def test_get_largest_values_in_shape_with_few_grid_cells(
+    sample_xarray_data,
+):
+    """
+    Test if the function handles shapes with few or no grid cells.
+
+    This test checks that the function returns all the grid cells in the
+    shape if there are fewer than requested, and no grid cells if there
+    are no grid cells in the shape.
+
+    Parameters
+    ----------
+    sample_xarray_data : xarray.DataArray
+        A 3x4 grid of values with "y" and "x" coordinates.
+    """
+    # Consider only the first row of grid cells to be in the shape.
+    fraction_in_shape = xarray.zeros_like(sample_xarray_data)
+    fraction_in_shape[0, :] = 1.0
+
+    # Check that the three valid grid cells of the row are returned.
+    largest_values = _get_largest_values(
+        sample_xarray_data, fraction_in_shape, 5
+    )
+    assert largest_values.to_numpy().tolist() == [2.0, 5.0, 9.0]
+
+    # Check that no grid cells are returned for an empty shape.
+    largest_values = _get_largest_values(
+        sample_xarray_data, xarray.zeros_like(sample_xarray_data), 3
+    )
+    assert largest_values.size == 0
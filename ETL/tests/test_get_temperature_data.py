@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+License: AGPL-3.0.
+
+Description:
+
+    This file contains unit tests for the functions of the script
+    extracting the temperature data.
+"""
+
+import os
+
+import numpy
+import pandas
+import pyarrow
+import pyarrow.parquet
+import pytest
+import pytz
+import xarray
+from get_temperature_data import (
+    build_temperature_database,
+    get_temperature_database_schema,
+    get_temperature_in_largest_population_density_areas,
+    read_stored_row_groups,
+)
+
+local_time_zone = pytz.timezone("America/New_York")
+
+
+@pytest.fixture
+def sample_temperature_time_series():
+    """
+    Fixture to provide sample temperature time series for testing.
+
+    This function creates two hourly temperature time series spanning
+    one year in UTC, with a seasonal cycle, a daily cycle, and some
+    missing values.
+
+    Returns
+    -------
+    tuple[pandas.Series, pandas.Series]
+        The temperature time series of the largest and of the 3 largest
+        population density areas, with a time index in UTC without
+        time zone information.
+    """
+    # Define a one-year-long time index with hourly resolution, in
+    # nanoseconds like the time index of the temperature data.
+    time_index = pandas.date_range("2023", "2024", freq="h", unit="ns")[:-1]
+
+    # Define the temperature values with a seasonal and a daily cycle.
+    hours = numpy.arange(len(time_index))
+    temperature_values = (
+        280
+        + 10 * numpy.sin(2 * numpy.pi * hours / len(hours))
+        + 3 * numpy.sin(2 * numpy.pi * hours / 24)
+    ).astype(numpy.float32)
+
+    # Remove some temperature values.
+    temperature_values[[5, 6, 1000]] = numpy.nan
+
+    return (
+        pandas.Series(temperature_values, index=time_index),
+        pandas.Series(temperature_values + 1, index=time_index),
+    )
+
+
+def test_build_temperature_database(sample_temperature_time_series):
+    """
+    Test if the function calculates the temperature statistics.
+
+    This test checks the local time columns and the temperature
+    statistics against a direct calculation with pandas.
+    """
+    # Build the temperature database.
+    temperature_top_1, temperature_top_3 = sample_temperature_time_series
+    temperature_database = build_temperature_database(
+        temperature_top_1, temperature_top_3, local_time_zone
+    )
+
+    # Get the local time of each time step.
+    local_times = temperature_top_1.index.tz_localize("UTC").tz_convert(
+        local_time_zone
+    )
+
+    # Check that the local time columns are correct.
+    assert (
+        temperature_database["Local hour of the day"].to_numpy()
+        == local_times.hour
+    ).all()
+    assert (
+        temperature_database["Local weekend indicator"].to_numpy()
+        == (local_times.dayofweek >= 5)
+    ).all()
+    assert (
+        temperature_database["Local month of the year"].to_numpy()
+        == local_times.month
+    ).all()
+    assert (
+        temperature_database["Local year"].to_numpy() == local_times.year
+    ).all()
+
+    # Calculate the monthly average temperature and its rank.
+    temperature_values = temperature_top_1.astype(float)
+    monthly_average_temperature = temperature_values.groupby(
+        local_times.month
+    ).mean()
+    monthly_average_temperature_rank = monthly_average_temperature.rank(
+        ascending=False
+    )
+
+    # Check that the monthly statistics are correct.
+    assert numpy.allclose(
+        temperature_database["Monthly average temperature - Top 1 (K)"],
+        monthly_average_temperature.reindex(local_times.month).to_numpy(),
+    )
+    assert (
+        temperature_database["Monthly average temperature rank - Top 1"]
+        .to_numpy()
+        .tolist()
+        == monthly_average_temperature_rank.reindex(local_times.month)
+        .to_numpy()
+        .tolist()
+    )
+
+    # Check that the annual statistics are correct.
+    assert numpy.allclose(
+        temperature_database["Annual average temperature - Top 1 (K)"],
+        temperature_values.mean(),
+    )
+    assert numpy.allclose(
+        temperature_database["5 percentile temperature - Top 1 (K)"],
+        temperature_values.quantile(0.05),
+    )
+    assert numpy.allclose(
+        temperature_database["95 percentile temperature - Top 1 (K)"],
+        temperature_values.quantile(0.95),
+    )
+
+    # Check that the temperature time series are unchanged.
+    assert numpy.array_equal(
+        temperature_database["Temperature - Top 3 (K)"],
+        temperature_top_3,
+        equal_nan=True,
+    )
+
+
+def test_build_temperature_database_schema(sample_temperature_time_series):
+    """
+    Test if the temperature database matches the stored schema.
+
+    This test checks that the columns, the index, and the data types of
+    the temperature database are the ones of the schema used to write
+    the parquet files.
+    """
+    # Build the temperature database.
+    temperature_database = build_temperature_database(
+        *sample_temperature_time_series, local_time_zone
+    )
+
+    # Check that the schema of the database is the stored schema.
+    assert pyarrow.Schema.from_pandas(
+        temperature_database, preserve_index=True
+    ).equals(get_temperature_database_schema(), check_metadata=False)
+
+
+def test_read_stored_row_groups(sample_temperature_time_series, tmp_path):
+    """
+    Test if the function reads the row group of each stored year.
+
+    This test writes the temperature database of two years in their own
+    row groups and checks that the row group of each year is found, and
+    that no row group is found if the file does not exist.
+    """
+    # Define the file path of the temperature time series.
+    file_path = os.path.join(tmp_path, "XX_temperature_time_series.parquet")
+
+    # Check that no row group is found if the file does not exist.
+    assert read_stored_row_groups(file_path) == {}
+
+    # Write the temperature database of the summer of two years, each
+    # in its own row group.
+    schema = get_temperature_database_schema()
+    with pyarrow.parquet.ParquetWriter(file_path, schema) as parquet_writer:
+        for year in [2021, 2023]:
+            temperature_top_1, temperature_top_3 = (
+                time_series.iloc[4000:4100].set_axis(
+                    time_series.index[4000:4100]
+                    + pandas.DateOffset(years=year - 2023)
+                )
+                for time_series in sample_temperature_time_series
+            )
+            temperature_database = build_temperature_database(
+                temperature_top_1, temperature_top_3, local_time_zone
+            )
+            parquet_writer.write_table(
+                pyarrow.Table.from_pandas(
+                    temperature_database, schema=schema, preserve_index=True
+                ),
+                row_group_size=len(temperature_database),
+            )
+
+    # Check that the row group of each year is found.
+    assert read_stored_row_groups(file_path) == {2021: 0, 2023: 1}
+
+
+def test_get_temperature_in_largest_population_density_areas_without_cells(
+    sample_temperature_time_series,
+):
+    """
+    Test if the function returns missing values without grid cells.
+
+    This test checks that, if the shape has no grid cells with valid
+    population densities, the temperature time series of the year only
+    contain missing values.
+    """
+    # Define the temperature data on a small grid.
+    temperature_top_1, _ = sample_temperature_time_series
+    temperature_data = xarray.DataArray(
+        numpy.broadcast_to(
+            temperature_top_1.to_numpy()[:, None, None],
+            (len(temperature_top_1), 2, 2),
+        ),
+        coords={
+            "valid_time": temperature_top_1.index,
+            "y": [40.0, 40.25],
+            "x": [-74.0, -73.75],
+        },
+        dims=["valid_time", "y", "x"],
+        name="t2m",
+    )
+
+    # Get the temperature data without any grid cell.
+    temperature_top_1, temperature_top_3 = (
+        get_temperature_in_largest_population_density_areas(
+            2023,
+            temperature_data,
+            local_time_zone,
+            numpy.array([], dtype=float),
+            numpy.array([], dtype=float),
+        )
+    )
+
+    # Check that the time series only contain missing values.
+    for time_series in [temperature_top_1, temperature_top_3]:
+        assert len(time_series) > 0
+        assert time_series.dtype == float
+        assert time_series.isna().all()
@@ -8,11 +8,13 @@ Description:
     and list yaml files in a specified folder.
 """
 
+import functools
 import os
 
 import yaml
 
 
+@functools.cache
 def read_folders_structure() -> dict[str, str]:
     """
     Read the folders structure.
@@ -21,7 +23,8 @@ def read_folders_structure() -> dict[str, str]:
     in the 'utils' directory. The yaml file should contain a dictionary
     where keys are folder names and values are their paths relative to
     the root folder. The root folder is determined as the parent
-    directory of the current file's directory.
+    directory of the current file's directory. The file is read only
+    once, and the same dictionary is returned by later calls.
 
     Returns
     -------
@@ -9,6 +9,7 @@ Description:
 """
 
 import datetime
+import functools
 import logging
 import os
 
@@ -340,6 +341,7 @@ def check_and_get_codes(
     return codes
 
 
+@functools.cache
 def get_iso_alpha_3_code(code: str) -> str:
     """
     Get the ISO Alpha-3 code of a country.
@@ -809,6 +811,7 @@ def get_available_years(code: str) -> list[int]:
     return [year for year in range(start_date.year, end_date.year + 1)]
 
 
+@functools.cache
 def get_continent_code(code: str) -> str:
     """
     Get the continent of a country or subdivision.
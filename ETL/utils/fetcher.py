@@ -10,19 +10,61 @@ Description:
     series from the ENTSO-E API.
 """
 
+import functools
+import hashlib
+import http.cookiejar
 import logging
+import os
 import re
+import tempfile
 import time
 import urllib.error
 import urllib.request
-from io import StringIO
+from io import BytesIO, StringIO
 
 import pandas
 import requests
+import requests.adapters
 import requests.exceptions
 from entsoe import EntsoePandasClient
 from entsoe.exceptions import NoMatchingDataError
 
+import utils.directories
+
+
+@functools.cache
+def _get_session() -> requests.Session:
+    """
+    Get the session used to send the HTTP requests.
+
+    This function creates a session shared by all the requests, so that
+    the connections to the same host are kept alive and reused, also
+    across the threads retrieving the requests of a data source. The
+    session does not store cookies, so that each request is sent as if
+    it was sent on its own.
+
+    Returns
+    -------
+    session : requests.Session
+        The session used to send the HTTP requests.
+    """
+    # Create the session.
+    session = requests.Session()
+
+    # Allow enough connections per host for the parallel requests.
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=16, pool_maxsize=16
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Do not store the cookies received from the servers.
+    session.cookies.set_policy(
+        http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+    )
+
+    return session
+
 
 def _read_aspx_params(
     response: requests.Response, post_data_params: dict[str, str | int]
@@ -70,6 +112,57 @@ def _read_aspx_params(
     return post_data_params
 
 
+def _fetch_cached_content(url: str, cache_max_age: float) -> BytesIO:
+    """
+    Fetch the content of a file through a local cache.
+
+    This function returns the content of the file at the specified URL
+    from a copy stored in the download cache folder. The file is only
+    downloaded if there is no copy yet or if the copy is older than the
+    specified maximum age.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the file.
+    cache_max_age : float
+        The maximum age in seconds of the cached copy of the file.
+
+    Returns
+    -------
+    BytesIO
+        The content of the file.
+    """
+    # Define the path of the cached copy of the file.
+    cache_directory = utils.directories.read_folders_structure()[
+        "download_cache_folder"
+    ]
+    os.makedirs(cache_directory, exist_ok=True)
+    cache_file_path = os.path.join(
+        cache_directory, hashlib.sha1(url.encode()).hexdigest()
+    )
+
+    # Download the file if there is no cached copy or if it is too old.
+    if (
+        not os.path.exists(cache_file_path)
+        or time.time() - os.path.getmtime(cache_file_path) > cache_max_age
+    ):
+        response = _get_session().get(url, timeout=60)
+        response.raise_for_status()
+
+        # Write the file to a temporary file first, so that an
+        # interrupted download does not leave an incomplete copy.
+        with tempfile.NamedTemporaryFile(
+            dir=cache_directory, delete=False
+        ) as temporary_file:
+            temporary_file.write(response.content)
+        os.replace(temporary_file.name, cache_file_path)
+
+    # Read the cached copy of the file.
+    with open(cache_file_path, "rb") as cache_file:
+        return BytesIO(cache_file.read())
+
+
 def fetch_data(
     url: str,
     content_type: str,
@@ -87,6 +180,7 @@ def fetch_data(
     header_params: dict[str, str] = {},
     json_keys: list[str] = [],
     query_aspx_webpage: bool = False,
+    cache_max_age: float | None = None,
 ) -> pandas.DataFrame | str | requests.Response:
     """
     Fetch the data from the specified URL.
@@ -127,6 +221,9 @@ def fetch_data(
         The keys to extract from the JSON response.
     query_aspx_webpage : bool, optional
         Whether to query the ASPX webpage.
+    cache_max_age : float | None, optional
+        The maximum age in seconds of a cached copy of CSV and Excel
+        files. If None, the files are read directly from the URL.
 
     Returns
     -------
@@ -143,12 +240,24 @@ def fetch_data(
     for attempt in range(retries):
         try:
             if content_type == "csv":
-                # Read the CSV file from the URL.
-                return pandas.read_csv(url, **csv_kwargs)
+                # Read the CSV file from the URL or from its cached
+                # copy.
+                return pandas.read_csv(
+                    url
+                    if cache_max_age is None
+                    else _fetch_cached_content(url, cache_max_age),
+                    **csv_kwargs,
+                )
 
             elif content_type == "excel":
-                # Read the Excel file from the URL.
-                return pandas.read_excel(url, **excel_kwargs)
+                # Read the Excel file from the URL or from its cached
+                # copy.
+                return pandas.read_excel(
+                    url
+                    if cache_max_age is None
+                    else _fetch_cached_content(url, cache_max_age),
+                    **excel_kwargs,
+                )
 
             elif content_type == "html":
                 if read_with == "urllib.request":
@@ -169,7 +278,7 @@ def fetch_data(
                 ):
                     if read_with == "requests.get":
                         # Send a GET request to the URL.
-                        response = requests.get(
+                        response = _get_session().get(
                             url,
                             timeout=10,
                             verify=verify_ssl,
@@ -181,7 +290,7 @@ def fetch_data(
                         if query_aspx_webpage:
                             # Read the HTML content from the URL using
                             # the requests module.
-                            response = requests.get(
+                            response = _get_session().get(
                                 url,
                                 timeout=10,
                                 verify=verify_ssl,
@@ -196,7 +305,7 @@ def fetch_data(
                             )
 
                         # Send a POST request to the URL.
-                        response = requests.post(
+                        response = _get_session().post(
                             url,
                             timeout=10,
                             verify=verify_ssl,
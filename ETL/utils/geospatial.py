@@ -202,7 +202,8 @@ def get_largest_values_in_shape(
     shape. It first calculates the fraction of each grid cell that is
     contained within the shape, then stacks the xarray data to drop
     NaN values, and finally returns the grid cells with the largest
-    values based on the specified number of grid cells.
+    values based on the specified number of grid cells, sorted in
+    ascending order of their values.
 
     Parameters
     ----------
@@ -230,9 +231,24 @@ def get_largest_values_in_shape(
         .dropna(dim="z")
     )
 
-    # Return the grid cells with the largest values.
-    return xarray_data_rearranged.sortby(xarray_data_rearranged).tail(
-        number_of_grid_cells
+    # Get the positions of the grid cells with the largest values
+    # without sorting all the values.
+    # The number of grid cells is limited to the number of grid cells
+    # in the shape, which may be zero.
+    values = xarray_data_rearranged.to_numpy()
+    number_of_grid_cells = min(number_of_grid_cells, values.size)
+    if number_of_grid_cells <= 0:
+        return xarray_data_rearranged.isel(z=slice(0, 0))
+    largest_value_positions = numpy.argpartition(
+        values, values.size - number_of_grid_cells
+    )[values.size - number_of_grid_cells :]
+
+    # Return the grid cells with the largest values, sorted in
+    # ascending order of their values.
+    return xarray_data_rearranged.isel(
+        z=largest_value_positions[
+            numpy.argsort(values[largest_value_positions])
+        ]
     )
 
 
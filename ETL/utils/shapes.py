@@ -9,6 +9,7 @@ Description:
     non-standard subdivision shapes from the shapes directory.
 """
 
+import functools
 import os
 
 import cartopy.io.shapereader
@@ -89,6 +90,72 @@ def _remove_islands(
     return entity_shape
 
 
+@functools.cache
+def _read_natural_earth_records(
+    shapefile_name: str,
+) -> list[cartopy.io.shapereader.Record]:
+    """
+    Read the records of a shapefile of the Natural Earth database.
+
+    The records are read once per shapefile and kept in memory, so that
+    the shapes of many countries or subdivisions can be retrieved
+    without parsing the shapefile again.
+
+    Parameters
+    ----------
+    shapefile_name : str
+        The name of the shapefile in the Natural Earth database.
+
+    Returns
+    -------
+    list[cartopy.io.shapereader.Record]
+        The records of the shapefile.
+    """
+    # Load the shapefile from the Natural Earth database.
+    all_shapes = cartopy.io.shapereader.natural_earth(
+        resolution="50m", category="cultural", name=shapefile_name
+    )
+
+    # Read the records of the shapefile.
+    return list(cartopy.io.shapereader.Reader(all_shapes).records())
+
+
+@functools.cache
+def _read_non_standard_shapes(data_source: str) -> geopandas.GeoDataFrame:
+    """
+    Read the non-standard shapes of a data source.
+
+    The shapefile of the data source is read once and kept in memory, so
+    that the shapes of its subdivisions can be retrieved without
+    parsing the shapefile again.
+
+    Parameters
+    ----------
+    data_source : str
+        The data source of the subdivision shapes.
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+        GeoDataFrame containing the shapes of the subdivisions of the
+        data source.
+    """
+    # Get the path to the shapes directory.
+    shapes_directory = utils.directories.read_folders_structure()[
+        "shapes_folder"
+    ]
+
+    # Define the path to the shapefile based on the data source.
+    shapefile_path = os.path.join(
+        shapes_directory, data_source, data_source + ".shp"
+    )
+
+    # Read the shapefile of the subdivisions of the data source through
+    # Arrow, which transfers the geometries in bulk instead of one
+    # feature at a time.
+    return geopandas.read_file(shapefile_path, use_arrow=True)
+
+
 def _get_standard_shape(
     code: str, remove_remote_islands: bool = True
 ) -> geopandas.GeoDataFrame:
@@ -133,21 +200,16 @@ def _get_standard_shape(
         secondary_keys = ["name"]
         target_key = iso_alpha_2_code + "-" + subdivision_code
 
-    # Load the shapefile containing the subdivision shapes from the
-    # Natural Earth database.
-    all_shapes = cartopy.io.shapereader.natural_earth(
-        resolution="50m", category="cultural", name=shapefile_name
-    )
-
-    # Define a reader for the shapefile.
-    reader = cartopy.io.shapereader.Reader(all_shapes)
+    # Read the records of the shapefile containing the country or
+    # subdivision shapes from the Natural Earth database.
+    records = _read_natural_earth_records(shapefile_name)
 
     try:
         # Read the shape of the country or subdivision of interest by
         # searching for its code.
         entity_shape = [
             shape
-            for shape in list(reader.records())
+            for shape in records
             if target_key in [shape.attributes[key] for key in main_keys]
         ][0]
     except IndexError:
@@ -162,7 +224,7 @@ def _get_standard_shape(
         # searching for its name.
         entity_shape = [
             shape
-            for shape in list(reader.records())
+            for shape in records
             if name in [shape.attributes[key] for key in secondary_keys]
         ][0]
 
@@ -206,13 +268,8 @@ def _read_non_standard_shape_codes() -> dict[str, list[str]]:
     for folder in os.listdir(shapes_directory):
         # Check if folder is a directory.
         if os.path.isdir(os.path.join(shapes_directory, folder)):
-            # Define the path to the shapefile.
-            shapefile_path = os.path.join(
-                shapes_directory, folder, folder + ".shp"
-            )
-
             # Read the shapefile of the subdivisions of the data source.
-            entity_shapes = geopandas.read_file(shapefile_path)
+            entity_shapes = _read_non_standard_shapes(folder)
 
             # Get the codes of the subdivisions in the shapefile.
             entity_codes = entity_shapes["code"].unique()
@@ -247,18 +304,8 @@ def _get_non_standard_shape(
     entity_shape : geopandas.GeoDataFrame
         GeoDataFrame containing the shape of the subdivision.
     """
-    # Get the path to the shapes directory.
-    shapes_directory = utils.directories.read_folders_structure()[
-        "shapes_folder"
-    ]
-
-    # Define the path to the shapefile based on the data source.
-    shapefile_path = os.path.join(
-        shapes_directory, data_source, data_source + ".shp"
-    )
-
     # Read the shapefile of the subdivisions of the data source.
-    entity_shapes = geopandas.read_file(shapefile_path)
+    entity_shapes = _read_non_standard_shapes(data_source)
 
     # Get the shape of the subdivision of interest.
     entity_shape = entity_shapes[entity_shapes["code"] == code]
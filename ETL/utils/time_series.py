@@ -172,16 +172,18 @@ def check_time_series_data_quality(time_series: pandas.Series) -> None:
         Original time series.
     """
     # Check if there are any missing values in the time series.
-    if time_series.isna().sum() > 0:
+    number_of_missing_values = time_series.isna().sum()
+    if number_of_missing_values > 0:
         logging.warning(
-            f"There are {time_series.isna().sum()} missing values in "
+            f"There are {number_of_missing_values} missing values in "
             "the time series."
         )
 
     # Check if there are any duplicated time steps in the time series.
-    if time_series.index.duplicated().sum() > 0:
+    number_of_duplicated_time_steps = time_series.index.duplicated().sum()
+    if number_of_duplicated_time_steps > 0:
         logging.warning(
-            f"There are {time_series.index.duplicated().sum()} duplicated "
+            f"There are {number_of_duplicated_time_steps} duplicated "
             "time steps in the time series."
         )
 